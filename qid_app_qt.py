@@ -20,7 +20,7 @@ from src import (
 )
 
 from ui_qt.main_window_qt import MainWindowQt
-from ui_qt.theme import get_stylesheet
+from ui_qt.theme import get_stylesheet, get_font, register_fonts
 
 
 class QIDAppQt:
@@ -137,7 +137,8 @@ class QIDAppQt:
         self.app.setStyleSheet(get_stylesheet())
         
         # Set default font
-        font = QFont("Inter, Segoe UI", 10)
+        register_fonts()
+        font = QFont(get_font(10))
         font.setHintingPreference(QFont.PreferNoHinting)
         self.app.setFont(font)
         
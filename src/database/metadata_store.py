@@ -3,9 +3,12 @@ QID - Metadata Store
 Stores image metadata (paths, dates, tags) in SQLite database.
 """
 
+import hashlib
+import math
+import os
 import sqlite3
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set, Tuple
 from datetime import datetime
 
 from ..utils.logger import get_logger
@@ -13,6 +16,51 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+class PathBloomFilter:
+    """
+    Compact, probabilistic set of file paths.
+    
+    Membership tests can give false positives (at about error_rate) but
+    never false negatives, so a hit has to be confirmed against the
+    database. Takes ~10 bits per path at 1%, against 100+ bytes per path
+    for a set of strings.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Initialize an empty filter.
+        
+        Args:
+            capacity: Expected number of paths
+            error_rate: Target false positive rate at capacity
+        """
+        capacity = max(1, capacity)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, file_path: str) -> List[int]:
+        """Bit positions for a path (double hashing of one 128-bit digest)."""
+        digest = hashlib.blake2b(
+            file_path.encode('utf-8', 'surrogatepass'), digest_size=16
+        ).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+    
+    def add(self, file_path: str):
+        """Add a path to the filter."""
+        bits = self._bits
+        for pos in self._positions(file_path):
+            bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, file_path: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(file_path))
+
+
 class MetadataStore:
     """
     SQLite database for storing image metadata.
@@ -159,6 +207,63 @@ class MetadataStore:
         logger.info(f"Added {added}/{len(metadata_list)} metadata entries")
         return added
     
+    def add_many(self, entries: List[Tuple[int, str]]) -> int:
+        """
+        Add metadata for many images in a single transaction.
+        
+        Unlike add_batch(), which commits once per image, this issues one
+        executemany and one commit.
+        
+        Args:
+            entries: List of (vector_id, file_path) pairs
+            
+        Returns:
+            Number of entries added (entries that already exist are skipped)
+            
+        Raises:
+            sqlite3.Error: If the insert fails; nothing is added
+        """
+        date_added = datetime.now().isoformat()
+        rows = []
+        
+        # Plain os.path calls; no Path objects for every row
+        for vector_id, file_path in entries:
+            try:
+                stat = os.stat(file_path)
+                file_size = stat.st_size
+                date_modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
+            except OSError:
+                file_size, date_modified = 0, None
+            
+            rows.append((
+                vector_id,
+                os.path.abspath(file_path),
+                os.path.basename(file_path),
+                file_size,
+                date_added,
+                date_modified
+            ))
+        
+        try:
+            with self.conn:
+                before = self.conn.total_changes
+                self.conn.executemany("""
+                    INSERT INTO images (
+                        vector_id, file_path, file_name, file_size,
+                        date_added, date_modified
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(file_path) DO NOTHING
+                """, rows)
+                added = self.conn.total_changes - before
+        except sqlite3.Error as e:
+            logger.error(f"Failed to add metadata: {e}")
+            raise
+        
+        if added < len(rows):
+            logger.warning(f"{len(rows) - added} images already exist")
+        
+        return added
+    
     def get(self, vector_id: int) -> Optional[Dict[str, Any]]:
         """
         Get metadata for a specific vector ID.
@@ -190,6 +295,57 @@ class MetadataStore:
         
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_all_paths(self) -> Set[str]:
+        """
+        Get the file paths of all indexed images in one query.
+        
+        Use this instead of calling exists() per file when checking many
+        paths at once.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT file_path FROM images")
+        
+        return {row[0] for row in cursor.fetchall()}
+    
+    def get_path_bloom(self, error_rate: float = 0.01) -> PathBloomFilter:
+        """
+        Get a Bloom filter of all indexed file paths.
+        
+        Much smaller than get_all_paths() for very large libraries; hits
+        must be confirmed with get_existing_paths().
+        
+        Args:
+            error_rate: Target false positive rate
+        """
+        bloom = PathBloomFilter(self.count(), error_rate)
+        
+        # Stream rows instead of fetching them all at once
+        cursor = self.conn.cursor()
+        for (file_path,) in cursor.execute("SELECT file_path FROM images"):
+            bloom.add(file_path)
+        
+        return bloom
+    
+    def get_existing_paths(self, file_paths: List[str]) -> Set[str]:
+        """
+        Get which of the given file paths are indexed.
+        
+        Queries in chunks, which is much cheaper than exists() per path.
+        """
+        existing = set()
+        cursor = self.conn.cursor()
+        
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(file_paths), 500):
+            chunk = file_paths[i:i + 500]
+            cursor.execute(
+                f"SELECT file_path FROM images WHERE file_path IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        
+        return existing
+    
     def exists(self, file_path: str) -> bool:
         """Check if image already exists in database."""
         return self.get_by_path(file_path) is not None
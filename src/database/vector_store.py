@@ -40,6 +40,8 @@ class VectorStore:
             index_type: 
                 - "Flat": Exact search (slower, perfect accuracy)
                 - "IVF": Approximate search (faster, 98%+ accuracy)
+                - "SQ8": Exact search over 8-bit quantized vectors
+                  (1/4 the memory, ~99% accuracy)
             metric:
                 - "cosine": Cosine similarity (angle between vectors)
                 - "l2": Euclidean distance
@@ -63,6 +65,8 @@ class VectorStore:
             # For cosine similarity, use Inner Product on normalized vectors
             if self.index_type == "Flat":
                 index = faiss.IndexFlatIP(self.dimension)
+            elif self.index_type == "SQ8":
+                index = self._create_sq8_index(faiss.METRIC_INNER_PRODUCT)
             else:
                 # IVF index for approximate search
                 quantizer = faiss.IndexFlatIP(self.dimension)
@@ -72,6 +76,8 @@ class VectorStore:
             # L2 (Euclidean) distance
             if self.index_type == "Flat":
                 index = faiss.IndexFlatL2(self.dimension)
+            elif self.index_type == "SQ8":
+                index = self._create_sq8_index(faiss.METRIC_L2)
             else:
                 quantizer = faiss.IndexFlatL2(self.dimension)
                 index = faiss.IndexIVFFlat(quantizer, self.dimension, 100)
@@ -81,6 +87,28 @@ class VectorStore:
         
         return index
     
+    def _create_sq8_index(self, metric: int) -> faiss.Index:
+        """
+        Create an 8-bit scalar quantized index (1 byte per dimension).
+        
+        Embeddings are unit length, so every component lies in [-1, 1];
+        training on that box fixes the quantizer range up front instead
+        of deriving it from whichever batch happens to be added first.
+        """
+        index = faiss.IndexScalarQuantizer(
+            self.dimension,
+            faiss.ScalarQuantizer.QT_8bit,
+            metric
+        )
+        
+        bounds = np.array([
+            np.full(self.dimension, -1.0),
+            np.full(self.dimension, 1.0)
+        ], dtype=np.float32)
+        index.train(bounds)
+        
+        return index
+    
     def add(self, embeddings: np.ndarray) -> List[int]:
         """
         Add embeddings to the index.
@@ -101,8 +129,9 @@ class VectorStore:
         if embeddings.ndim == 1:
             embeddings = embeddings.reshape(1, -1)
         
-        # Ensure float32 (FAISS requirement)
-        embeddings = embeddings.astype(np.float32)
+        # Ensure C-contiguous float32 (FAISS requirement); no copy if the
+        # encoder already produced that, as ImageEncoder.encode_batch does
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
         
         # Train index if needed (for IVF)
         if self.index_type == "IVF" and not self.index.is_trained:
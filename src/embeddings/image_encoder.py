@@ -8,7 +8,7 @@ import clip
 import numpy as np
 from PIL import Image
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 from tqdm import tqdm
 
 from ..utils.logger import get_logger
@@ -128,7 +128,8 @@ class ImageEncoder:
         self,
         images: List[Union[str, Path, Image.Image]],
         batch_size: int = 32,
-        show_progress: bool = True
+        show_progress: bool = True,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         Encode multiple images efficiently in batches.
@@ -140,9 +141,12 @@ class ImageEncoder:
             images: List of image paths or PIL Images
             batch_size: Number of images to process together
             show_progress: Show progress bar
+            out: Optional preallocated float32 array of shape
+                (num_images, dim) to write the embeddings into, e.g. a
+                slice of a buffer reused across calls
             
         Returns:
-            Array of embeddings, shape (num_images, 512)
+            Array of embeddings, shape (num_images, 512) (out, if given)
             
         Example:
             >>> encoder = ImageEncoder()
@@ -150,8 +154,6 @@ class ImageEncoder:
             >>> embeddings = encoder.encode_batch(paths)
             >>> print(embeddings.shape)  # (3, 512)
         """
-        all_embeddings = []
-        
         # Process in batches
         num_batches = (len(images) + batch_size - 1) // batch_size
         
@@ -164,13 +166,21 @@ class ImageEncoder:
                 unit="batch"
             )
         
+        # Each batch is written straight into its rows of the output,
+        # instead of collecting the batches and stacking them at the end
+        embeddings = out
         for i in iterator:
             batch = images[i:i + batch_size]
             batch_embeddings = self._encode_batch_internal(batch)
-            all_embeddings.append(batch_embeddings)
+            if embeddings is None:
+                embeddings = np.empty(
+                    (len(images), batch_embeddings.shape[1]),
+                    dtype=np.float32
+                )
+            embeddings[i:i + len(batch)] = batch_embeddings
         
-        # Combine all batches
-        embeddings = np.vstack(all_embeddings)
+        if embeddings is None:
+            embeddings = np.empty((0, self.embedding_dim), dtype=np.float32)
         
         logger.info(f"✅ Encoded {len(images)} images")
         return embeddings
@@ -4,7 +4,7 @@ Includes automatic cleanup of missing images.
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable
 from tqdm import tqdm
 
 from ..embeddings.image_encoder import ImageEncoder
@@ -67,7 +67,8 @@ class BatchIndexer:
         recursive: bool = True,
         validate: bool = True,
         skip_existing: bool = True,
-        clean_missing: bool = True
+        clean_missing: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> Dict[str, int]:
         """
         Index all images in a directory with automatic cleanup.
@@ -78,6 +79,8 @@ class BatchIndexer:
             validate: Validate images before processing
             skip_existing: Skip already-indexed images
             clean_missing: Automatically clean missing images before indexing
+            progress_callback: Optional function(done, total) called after
+                each encoded batch (runs on the indexing thread)
             
         Returns:
             Dictionary with statistics:
@@ -143,8 +146,7 @@ class BatchIndexer:
         # Step 3: Filter already-processed images
         if skip_existing:
             print("\n🔎 Step 3: Checking for existing images...")
-            existing_metadata = self.metadata_store.get_all()
-            existing_paths = {m['file_path'] for m in existing_metadata}
+            existing_paths = self.metadata_store.get_all_paths()
             
             image_paths = self.image_processor.filter_existing(
                 image_paths,
@@ -160,7 +162,7 @@ class BatchIndexer:
         
         # Step 4: Process images in batches
         print(f"\n🚀 Step 4: Processing {len(image_paths)} images...")
-        processed = self._process_batch(image_paths)
+        processed = self._process_batch(image_paths, progress_callback)
         stats['processed'] = processed
         
         # Step 5: Save to disk
@@ -240,10 +242,18 @@ class BatchIndexer:
         """
         return self.cleaner.generate_report()
     
-    def _process_batch(self, image_paths: List[Path]) -> int:
+    def _process_batch(
+        self,
+        image_paths: List[Path],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> int:
         """
         Process a batch of images.
         
+        Args:
+            image_paths: Images to encode and store
+            progress_callback: Optional function(done, total) called per batch
+        
         Returns:
             Number of images successfully processed
         """
@@ -282,7 +292,9 @@ class BatchIndexer:
                 
             except Exception as e:
                 logger.error(f"Batch processing failed: {e}")
-                continue
+            
+            if progress_callback:
+                progress_callback(min(i + self.batch_size, len(image_paths)), len(image_paths))
         
         return processed
     
@@ -5,9 +5,13 @@ Displays search results as a grid of thumbnails.
 
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 from pathlib import Path
+from collections import OrderedDict
 import os
+import platform
+import subprocess
+
+import numpy as np
 
 
 class ImageGrid(ttk.Frame):
@@ -35,7 +39,24 @@ class ImageGrid(ttk.Frame):
         self.columns = columns
         self.thumbnail_size = thumbnail_size
         self.results = []
-        self.photo_images = []  # Keep references to prevent garbage collection
+        
+        # Result columns (struct-of-arrays) used while rendering tiles
+        self._paths = []
+        self._names = []
+        self._scores = np.empty(0, dtype=np.float32)
+        self._color_mask = np.empty(0, dtype=bool)
+        
+        # One persistent PhotoImage per tile slot; new thumbnails are pasted
+        # into it so Tk's pixel buffers are reused across searches
+        self.tile_photos = []
+        
+        # LRU of recently decoded thumbnails (path -> PIL image) so repeated
+        # searches don't decode the same files again
+        self.thumbnail_cache = OrderedDict()
+        self.thumbnail_cache_size = 128
+        
+        # System viewer command for macOS/Linux
+        self._opener = 'open' if platform.system() == 'Darwin' else 'xdg-open'
         
         self._create_widgets()
         self._setup_layout()
@@ -61,8 +82,10 @@ class ImageGrid(ttk.Frame):
         self.grid_frame.bind('<Configure>', self._on_frame_configure)
         self.canvas.bind('<Configure>', self._on_canvas_configure)
         
-        # Bind mousewheel
-        self.canvas.bind_all('<MouseWheel>', self._on_mousewheel)
+        # Bind mousewheel only while the pointer is over the grid, so other
+        # widgets (and other grids) keep their own scrolling
+        self.canvas.bind('<Enter>', self._bind_mousewheel)
+        self.canvas.bind('<Leave>', self._unbind_mousewheel)
     
     def _setup_layout(self):
         """Arrange widgets."""
@@ -77,6 +100,14 @@ class ImageGrid(ttk.Frame):
         """Update canvas window width when canvas resizes."""
         self.canvas.itemconfig(self.canvas_window, width=event.width)
     
+    def _bind_mousewheel(self, event=None):
+        """Route mousewheel events to this grid while hovered."""
+        self.canvas.bind_all('<MouseWheel>', self._on_mousewheel)
+    
+    def _unbind_mousewheel(self, event=None):
+        """Release mousewheel events when the pointer leaves the grid."""
+        self.canvas.unbind_all('<MouseWheel>')
+    
     def _on_mousewheel(self, event):
         """Handle mousewheel scrolling."""
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -93,22 +124,32 @@ class ImageGrid(ttk.Frame):
         
         self.results = results
         
+        # Unpack into columns once instead of per-tile dict lookups
+        self._paths = [r['file_path'] for r in results]
+        self._names = [r['file_name'] for r in results]
+        self._scores = np.fromiter((r['score'] for r in results), dtype=np.float32, count=len(results))
+        self._color_mask = self._scores > 0.8
+        
+        # Free tile buffers left over from a larger earlier search, so
+        # memory follows the current result count
+        del self.tile_photos[len(self._paths):]
+        
         # Create grid items
-        for i, result in enumerate(results):
+        for i in range(len(results)):
             row = i // self.columns
             col = i % self.columns
             
-            self._create_grid_item(result, row, col)
+            self._create_grid_item(i, row, col)
         
         # Scroll to top
         self.canvas.yview_moveto(0)
     
-    def _create_grid_item(self, result, row, col):
+    def _create_grid_item(self, index, row, col):
         """
         Create a single grid item (thumbnail + info).
         
         Args:
-            result: Result dictionary
+            index: Index into the current result columns
             row: Grid row
             col: Grid column
         """
@@ -118,7 +159,7 @@ class ImageGrid(ttk.Frame):
         
         # Load and resize image
         try:
-            img_path = result['file_path']
+            img_path = self._paths[index]
             
             # Check if file exists
             if not Path(img_path).exists():
@@ -126,15 +167,9 @@ class ImageGrid(ttk.Frame):
                 self._create_placeholder(item_frame, "File not found")
                 return
             
-            # Load image
-            img = Image.open(img_path)
-            
-            # Resize maintaining aspect ratio
-            img.thumbnail((self.thumbnail_size, self.thumbnail_size), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(img)
-            self.photo_images.append(photo)  # Keep reference
+            # Load thumbnail (cached) into this tile's buffer
+            photo = self._get_tile_photo(index)
+            photo.paste(self._get_thumbnail(img_path))
             
             # Image label
             img_label = ttk.Label(item_frame, image=photo)
@@ -150,22 +185,80 @@ class ImageGrid(ttk.Frame):
         # Filename
         filename_label = ttk.Label(
             item_frame,
-            text=result['file_name'],
+            text=self._names[index],
             font=('Arial', 9),
             wraplength=self.thumbnail_size
         )
         filename_label.pack(pady=(0, 2))
         
         # Score
-        score_text = f"Match: {result['score']:.1%}"
+        score_text = f"Match: {self._scores[index]:.1%}"
         score_label = ttk.Label(
             item_frame,
             text=score_text,
             font=('Arial', 8, 'bold'),
-            foreground='green' if result['score'] > 0.8 else 'orange'
+            foreground='green' if self._color_mask[index] else 'orange'
         )
         score_label.pack(pady=(0, 5))
     
+    def _get_thumbnail(self, img_path):
+        """
+        Get thumbnail for an image, decoding it only on a cache miss.
+        
+        Args:
+            img_path: Path to image file
+            
+        Returns:
+            Square RGBA PIL image of thumbnail_size, centered with
+            transparent padding so it can be pasted into a tile buffer
+        """
+        thumb = self.thumbnail_cache.get(img_path)
+        if thumb is not None:
+            self.thumbnail_cache.move_to_end(img_path)
+            return thumb
+        
+        # Pillow is only needed once there are results to show
+        from PIL import Image
+        
+        # Load image
+        img = Image.open(img_path)
+        
+        # Resize maintaining aspect ratio
+        img.thumbnail((self.thumbnail_size, self.thumbnail_size), Image.Resampling.LANCZOS)
+        
+        # Pad to the tile size
+        thumb = Image.new('RGBA', (self.thumbnail_size, self.thumbnail_size), (0, 0, 0, 0))
+        thumb.paste(
+            img.convert('RGBA'),
+            ((self.thumbnail_size - img.width) // 2, (self.thumbnail_size - img.height) // 2)
+        )
+        
+        self.thumbnail_cache[img_path] = thumb
+        if len(self.thumbnail_cache) > self.thumbnail_cache_size:
+            # Evict oldest
+            self.thumbnail_cache.popitem(last=False)
+        
+        return thumb
+    
+    def _get_tile_photo(self, index):
+        """
+        Get the persistent PhotoImage for a tile slot, creating it on first use.
+        
+        Args:
+            index: Tile index in the grid
+            
+        Returns:
+            ImageTk.PhotoImage of thumbnail_size x thumbnail_size
+        """
+        from PIL import ImageTk
+        
+        while len(self.tile_photos) <= index:
+            self.tile_photos.append(
+                ImageTk.PhotoImage('RGBA', (self.thumbnail_size, self.thumbnail_size))
+            )
+        
+        return self.tile_photos[index]
+    
     def _create_placeholder(self, parent, text):
         """Create placeholder for missing images."""
         placeholder = tk.Canvas(parent, width=self.thumbnail_size, height=self.thumbnail_size, bg='gray')
@@ -191,18 +284,25 @@ class ImageGrid(ttk.Frame):
             if os.name == 'nt':  # Windows
                 os.startfile(image_path)
             elif os.name == 'posix':  # macOS/Linux
-                import subprocess
-                subprocess.call(['open' if os.uname().sysname == 'Darwin' else 'xdg-open', image_path])
+                # Fire and forget so the UI doesn't wait on the viewer launching
+                subprocess.Popen(
+                    [self._opener, image_path],
+                    start_new_session=True,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
         except Exception as e:
             print(f"Failed to open image: {e}")
     
     def clear(self):
         """Clear all grid items."""
-        # Clear photo references
-        self.photo_images.clear()
-        
         # Destroy all children
         for widget in self.grid_frame.winfo_children():
             widget.destroy()
         
-        self.results = []
\ No newline at end of file
+        self.results = []
+        self._paths = []
+        self._names = []
+        self._scores = np.empty(0, dtype=np.float32)
+        self._color_mask = np.empty(0, dtype=bool)
\ No newline at end of file
@@ -6,6 +6,7 @@ Dialog for indexing images from a folder.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+import queue
 
 
 class IndexDialog:
@@ -19,7 +20,7 @@ class IndexDialog:
     - Real-time status updates
     """
     
-    def __init__(self, parent, batch_indexer, on_complete=None):
+    def __init__(self, parent, batch_indexer, on_complete=None, is_busy=None):
         """
         Initialize index dialog.
         
@@ -27,10 +28,19 @@ class IndexDialog:
             parent: Parent window
             batch_indexer: BatchIndexer instance
             on_complete: Callback function(stats: dict)
+            is_busy: Optional callable; True while other indexing is running
         """
         self.parent = parent
         self.batch_indexer = batch_indexer
         self.on_complete = on_complete
+        self.is_busy = is_busy
+        
+        # True while the indexing thread is running (it may outlive the dialog)
+        self.indexing = False
+        
+        # Progress updates posted by the indexing thread, drained on the Tk loop
+        self._progress_q = queue.Queue()
+        self._draining = False
         
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Index Images")
@@ -148,6 +158,13 @@ class IndexDialog:
             messagebox.showwarning("No Folder", "Please select a folder")
             return
         
+        # The indexer isn't safe to run twice at once
+        if self.indexing or (self.is_busy and self.is_busy()):
+            messagebox.showwarning("Indexing in Progress", "Please wait for the current indexing to finish")
+            return
+        
+        self.indexing = True
+        
         # Disable controls
         self.start_btn.config(state='disabled')
         
@@ -159,6 +176,33 @@ class IndexDialog:
         thread = threading.Thread(target=self._index_thread, args=(folder,))
         thread.daemon = True
         thread.start()
+        
+        # Poll for progress
+        self._draining = True
+        self.dialog.after(50, self._drain_progress)
+    
+    def _drain_progress(self):
+        """Apply the latest queued progress update and reschedule."""
+        if not self._draining or not self.dialog.winfo_exists():
+            return
+        
+        # Only the most recent update matters; drop the rest
+        latest = None
+        try:
+            while True:
+                latest = self._progress_q.get_nowait()
+        except queue.Empty:
+            pass
+        
+        if latest is not None:
+            done, total = latest
+            if str(self.progress_bar['mode']) != 'determinate':
+                self.progress_bar.stop()
+                self.progress_bar['mode'] = 'determinate'
+            self.progress_var.set(done / total * 100 if total else 0)
+            self.details_label.config(text=f"Processed: {done} / {total}")
+        
+        self.dialog.after(50, self._drain_progress)
     
     def _index_thread(self, folder):
         """
@@ -173,14 +217,17 @@ class IndexDialog:
                 folder,
                 recursive=self.recursive_var.get(),
                 validate=self.validate_var.get(),
-                skip_existing=self.skip_existing_var.get()
+                skip_existing=self.skip_existing_var.get(),
+                progress_callback=lambda n, total: self._progress_q.put((n, total))
             )
             
             # Update UI on main thread
             self.dialog.after(0, lambda: self._on_indexing_complete(stats))
             
         except Exception as e:
-            self.dialog.after(0, lambda: self._on_indexing_error(str(e)))
+            # e is unbound once the except block ends; capture the message
+            msg = str(e)
+            self.dialog.after(0, lambda: self._on_indexing_error(msg))
     
     def _on_indexing_complete(self, stats):
         """
@@ -190,6 +237,8 @@ class IndexDialog:
             stats: Indexing statistics dictionary
         """
         # Stop progress
+        self.indexing = False
+        self._draining = False
         self.progress_bar.stop()
         self.progress_bar['mode'] = 'determinate'
         self.progress_var.set(100)
@@ -215,6 +264,8 @@ class IndexDialog:
             error: Error message
         """
         # Stop progress
+        self.indexing = False
+        self._draining = False
         self.progress_bar.stop()
         
         # Update status
@@ -6,6 +6,7 @@ Primary application window with search and navigation.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
+import threading
 
 from .components.search_panel import SearchPanel
 from .components.image_grid import ImageGrid
@@ -47,6 +48,10 @@ class MainWindow:
         self.batch_indexer = batch_indexer
         self.config = config
         
+        # Only one indexing run at a time (files thread or folder dialog)
+        self._indexing = False
+        self._index_dialog = None
+        
         # Configure window
         self.root.title(config.get('ui.window_title'))
         
@@ -75,7 +80,7 @@ class MainWindow:
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Index Folder...", command=self._index_folder)
-        file_menu.add_command(label="Index Single Image...", command=self._index_single)
+        file_menu.add_command(label="Index Images...", command=self._index_single)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
         
@@ -161,44 +166,116 @@ class MainWindow:
             messagebox.showerror("Search Error", f"Search failed:\n{e}")
             self.status_bar.set_message("Search failed")
     
+    def _is_indexing(self) -> bool:
+        """Whether selected files or a folder are being indexed."""
+        return self._indexing or (self._index_dialog is not None and self._index_dialog.indexing)
+    
+    def _refuse_if_indexing(self) -> bool:
+        """Tell the user to wait if indexing is running; True if it is."""
+        if self._is_indexing():
+            messagebox.showwarning("Indexing in Progress", "Please wait for the current indexing to finish")
+            return True
+        return False
+    
     def _index_folder(self):
         """Open dialog to index a folder."""
-        dialog = IndexDialog(
+        if self._refuse_if_indexing():
+            return
+        
+        self._index_dialog = IndexDialog(
             self.root,
             self.batch_indexer,
-            on_complete=self._on_index_complete
+            on_complete=self._on_index_complete,
+            is_busy=lambda: self._indexing
         )
     
     def _index_single(self):
-        """Index a single image file."""
-        file_path = filedialog.askopenfilename(
-            title="Select Image",
+        """Index one or more selected image files."""
+        if self._refuse_if_indexing():
+            return
+        
+        file_paths = filedialog.askopenfilenames(
+            title="Select Images",
             filetypes=[
                 ("Image files", "*.jpg *.jpeg *.png *.bmp *.gif *.webp"),
                 ("All files", "*.*")
             ]
         )
         
-        if not file_path:
+        # Checked again: indexing may have started while the file dialog was open
+        if not file_paths or self._refuse_if_indexing():
             return
         
+        self._indexing = True
+        
         # Update status
-        self.status_bar.set_message(f"Indexing: {Path(file_path).name}...")
-        self.root.update()
+        self.status_bar.set_message(f"Indexing {len(file_paths)} image(s)...")
+        
+        # Run in background thread so the UI stays responsive
+        thread = threading.Thread(target=self._index_files_thread, args=(file_paths,))
+        thread.daemon = True
+        thread.start()
+    
+    def _index_files_thread(self, file_paths):
+        """
+        Background thread for indexing selected files.
+        
+        Args:
+            file_paths: Tuple of image file paths
+        """
+        indexed = 0
+        skipped = 0
+        total = len(file_paths)
         
         try:
-            success = self.batch_indexer.index_single_image(file_path)
+            for i, file_path in enumerate(file_paths, start=1):
+                self.root.after(0, lambda n=i, p=file_path: self.status_bar.set_message(
+                    f"Indexing ({n}/{total}): {Path(p).name}..."
+                ))
+                
+                if self.batch_indexer.index_single_image(file_path):
+                    indexed += 1
+                else:
+                    skipped += 1
             
-            if success:
-                messagebox.showinfo("Success", f"Image indexed successfully!")
-                self._update_stats()
-            else:
-                messagebox.showwarning("Already Indexed", "Image already in database")
+            self.root.after(0, lambda: self._on_index_files_complete(indexed, skipped))
             
         except Exception as e:
-            messagebox.showerror("Indexing Error", f"Failed to index image:\n{e}")
+            # e is unbound once the except block ends; capture the message
+            msg = str(e)
+            self.root.after(0, lambda: self._on_index_files_error(msg))
+    
+    def _on_index_files_complete(self, indexed, skipped):
+        """
+        Called when file indexing completes.
         
+        Args:
+            indexed: Number of images indexed
+            skipped: Number of images already indexed or invalid
+        """
+        self._indexing = False
+        self._update_stats()
+        self.status_bar.set_message("Ready")
+        
+        if indexed:
+            msg = f"Indexed {indexed} image(s) successfully!"
+            if skipped:
+                msg += f"\nSkipped {skipped} already indexed or invalid image(s)"
+            messagebox.showinfo("Success", msg)
+        else:
+            messagebox.showwarning("Already Indexed", "Selected images are already in database")
+    
+    def _on_index_files_error(self, error):
+        """
+        Called when file indexing fails.
+        
+        Args:
+            error: Error message
+        """
+        self._indexing = False
+        self._update_stats()
         self.status_bar.set_message("Ready")
+        messagebox.showerror("Indexing Error", f"Failed to index image:\n{error}")
     
     def _on_index_complete(self, stats):
         """
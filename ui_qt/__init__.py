@@ -1,24 +1,38 @@
 """
 QID - Qt UI Package
 Modern PySide6 interface with frameless window and integrated navigation.
+
+Exports are resolved lazily (PEP 562) so importing one screen does not
+pull in every other Qt module.
 """
 
-from .main_window_qt import MainWindowQt
-from .home_screen import HomeScreen
-from .search_screen import SearchScreen
-from .index_screen import IndexScreen
-from .settings_screen import SettingsScreen
-from .image_grid_qt import ImageGridQt
-from .theme import get_stylesheet, COLORS, FONTS
-
-__all__ = [
-    'MainWindowQt',
-    'HomeScreen',
-    'SearchScreen',
-    'IndexScreen',
-    'SettingsScreen',
-    'ImageGridQt',
-    'get_stylesheet',
-    'COLORS',
-    'FONTS'
-]
\ No newline at end of file
+import importlib
+
+_EXPORTS = {
+    'MainWindowQt': '.main_window_qt',
+    'HomeScreen': '.home_screen',
+    'SearchScreen': '.search_screen',
+    'IndexScreen': '.index_screen',
+    'SettingsScreen': '.settings_screen',
+    'ImageGridQt': '.image_grid_qt',
+    'get_stylesheet': '.theme',
+    'COLORS': '.theme',
+    'FONTS': '.theme',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the module providing `name` on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,18 +5,106 @@ Redesigned to match professional UI standards.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QPushButton, QFrame, QGraphicsOpacityEffect
+    QPushButton, QFrame
 )
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal
-from PySide6.QtGui import QFont, QPixmap
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QFont, QPixmap, QImageReader
 from pathlib import Path
 
-from .theme import COLORS, SPACING, RADIUS
+from .theme import COLORS, SPACING, RADIUS, get_font
+
+
+# Stylesheet for the whole home screen, parsed once on HomeScreen instead
+# of once per card/label
+HOME_QSS = f"""
+    QWidget {{
+        background: {COLORS['background']};
+    }}
+    QLabel#home_logo_text {{
+        color: white;
+        background: transparent;
+    }}
+    QLabel#home_subtitle {{
+        color: {COLORS['text_primary']};
+        font-weight: 400;
+        background: transparent;
+    }}
+    QLabel#home_tagline {{
+        color: {COLORS['text_tertiary']};
+        letter-spacing: 1.5px;
+        background: transparent;
+    }}
+    #feature_card {{
+        background: {COLORS['glass']};
+        border: 1px solid {COLORS['glass_border']};
+        border-radius: {RADIUS['xl']};
+    }}
+    #feature_card:hover {{
+        background: rgba(21, 27, 45, 0.9);
+        border-color: rgba(79, 108, 255, 0.4);
+    }}
+    #feature_card QLabel {{
+        background: transparent;
+    }}
+    QLabel#feature_icon {{
+        font-size: 56px;
+    }}
+    QLabel#feature_title {{
+        color: {COLORS['text_primary']};
+        margin-top: 8px;
+    }}
+    QLabel#feature_description {{
+        color: {COLORS['text_secondary']};
+    }}
+    QPushButton#feature_button {{
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 {COLORS['gradient_start']}, 
+            stop:1 {COLORS['gradient_end']}
+        );
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 12px 28px;
+        margin-top: 16px;
+    }}
+    QPushButton#feature_button:hover {{
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #7c8ef5, 
+            stop:1 #8b5cb8
+        );
+    }}
+    QPushButton#feature_button:pressed {{
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #5563d4, 
+            stop:1 #6843a0
+        );
+    }}
+"""
+
+
+# Font specs (point size, weight) for the home screen, resolved through
+# the shared theme fonts
+HOME_FONT_SPECS = {
+    "logo": (56, QFont.Bold),
+    "subtitle": (22, QFont.Normal),
+    "tagline": (11, QFont.Medium),
+    "card_title": (18, QFont.DemiBold),
+    "card_description": (13, QFont.Normal),
+    "card_button": (13, QFont.Medium),
+}
+
+
+def _home_font(role: str) -> QFont:
+    """Shared QFont for a HOME_FONT_SPECS role."""
+    return get_font(*HOME_FONT_SPECS[role])
 
 
 class FeatureCard(QFrame):
     """
-    Professional animated card.
+    Professional card; hover feedback comes from the #feature_card:hover rule.
     """
     
     clicked = Signal()
@@ -27,19 +115,7 @@ class FeatureCard(QFrame):
         self.setObjectName("feature_card")
         self.setCursor(Qt.PointingHandCursor)
         
-        # Professional card styling
-        self.setStyleSheet(f"""
-            #feature_card {{
-                background: {COLORS['glass']};
-                border: 1px solid {COLORS['glass_border']};
-                border-radius: {RADIUS['xl']};
-            }}
-            #feature_card:hover {{
-                background: rgba(21, 27, 45, 0.9);
-                border-color: rgba(79, 108, 255, 0.4);
-            }}
-        """)
-        
+        # Card styling comes from HOME_QSS on HomeScreen
         # Layout with proper padding
         layout = QVBoxLayout(self)
         layout.setContentsMargins(32, 32, 32, 32)
@@ -49,102 +125,33 @@ class FeatureCard(QFrame):
         # Icon
         icon_label = QLabel(icon)
         icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("""
-            font-size: 56px;
-            background: transparent;
-        """)
+        icon_label.setObjectName("feature_icon")
         
         # Title - Professional font
         title_label = QLabel(title)
         title_label.setAlignment(Qt.AlignCenter)
-        font = QFont("Inter, Segoe UI, sans-serif", 18, QFont.DemiBold)
-        title_label.setFont(font)
-        title_label.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            margin-top: 8px;
-            background: transparent;
-        """)
+        title_label.setFont(_home_font("card_title"))
+        title_label.setObjectName("feature_title")
         
         # Description - Refined
         desc_label = QLabel(description)
         desc_label.setAlignment(Qt.AlignCenter)
         desc_label.setWordWrap(True)
         desc_label.setMaximumWidth(280)
-        font = QFont("Inter, Segoe UI, sans-serif", 13)
-        desc_label.setFont(font)
-        desc_label.setStyleSheet(f"""
-            color: {COLORS['text_secondary']};
-            background: transparent;
-        """)
+        desc_label.setFont(_home_font("card_description"))
+        desc_label.setObjectName("feature_description")
         
         # Button - More professional
         button = QPushButton("Get Started")
         button.clicked.connect(self.clicked.emit)
-        font = QFont("Inter, Segoe UI, sans-serif", 13, QFont.Medium)
-        button.setFont(font)
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {COLORS['gradient_start']}, 
-                    stop:1 {COLORS['gradient_end']}
-                );
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px 28px;
-                margin-top: 16px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #7c8ef5, 
-                    stop:1 #8b5cb8
-                );
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #5563d4, 
-                    stop:1 #6843a0
-                );
-            }}
-        """)
+        button.setFont(_home_font("card_button"))
+        button.setObjectName("feature_button")
         
         layout.addWidget(icon_label)
         layout.addWidget(title_label)
         layout.addWidget(desc_label)
         layout.addStretch()
         layout.addWidget(button, alignment=Qt.AlignCenter)
-        
-        # Subtle animation
-        self.opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self.opacity_effect)
-        self.opacity_effect.setOpacity(0.92)
-        
-        self._setup_animations()
-    
-    def _setup_animations(self):
-        """Setup subtle hover animation."""
-        self.hover_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.hover_animation.setDuration(150)
-        self.hover_animation.setEasingCurve(QEasingCurve.OutCubic)
-    
-    def enterEvent(self, event):
-        """Hover in."""
-        self.hover_animation.stop()
-        self.hover_animation.setStartValue(self.opacity_effect.opacity())
-        self.hover_animation.setEndValue(1.0)
-        self.hover_animation.start()
-        super().enterEvent(event)
-    
-    def leaveEvent(self, event):
-        """Hover out."""
-        self.hover_animation.stop()
-        self.hover_animation.setStartValue(self.opacity_effect.opacity())
-        self.hover_animation.setEndValue(0.92)
-        self.hover_animation.start()
-        super().leaveEvent(event)
 
 
 class HomeScreen(QWidget):
@@ -158,7 +165,7 @@ class HomeScreen(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.setStyleSheet(f"background: {COLORS['background']};")
+        self.setStyleSheet(HOME_QSS)
         
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -181,43 +188,29 @@ class HomeScreen(QWidget):
         logo = QLabel()
         logo_path = Path("assets/logo.png")
         if logo_path.exists():
-            pixmap = QPixmap(str(logo_path))
-            # Scale logo to appropriate size (128x128 for hero)
-            scaled_pixmap = pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo.setPixmap(scaled_pixmap)
+            # Decode straight to the hero size (128x128 box) and convert once
+            reader = QImageReader(str(logo_path))
+            reader.setScaledSize(reader.size().scaled(128, 128, Qt.KeepAspectRatio))
+            logo.setPixmap(QPixmap.fromImage(reader.read()))
             logo.setAlignment(Qt.AlignCenter)
         else:
             # Fallback to text if logo not found
             logo.setText("QID")
-            font = QFont("Inter, Segoe UI, sans-serif", 56, QFont.Bold)
-            logo.setFont(font)
-            logo.setStyleSheet("""
-                color: white;
-                background: transparent;
-            """)
+            logo.setFont(_home_font("logo"))
+            logo.setObjectName("home_logo_text")
             logo.setAlignment(Qt.AlignCenter)
         
         # Subtitle - Clean
         subtitle = QLabel("Query Images by Description")
         subtitle.setAlignment(Qt.AlignCenter)
-        font = QFont("Inter, Segoe UI, sans-serif", 22)
-        subtitle.setFont(font)
-        subtitle.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            font-weight: 400;
-            background: transparent;
-        """)
+        subtitle.setFont(_home_font("subtitle"))
+        subtitle.setObjectName("home_subtitle")
         
         # Tagline - Subtle
         tagline = QLabel("LOCAL • PRIVACY FOCUSED")
         tagline.setAlignment(Qt.AlignCenter)
-        font = QFont("Inter, Segoe UI, sans-serif", 11, QFont.Medium)
-        tagline.setFont(font)
-        tagline.setStyleSheet(f"""
-            color: {COLORS['text_tertiary']};
-            letter-spacing: 1.5px;
-            background: transparent;
-        """)
+        tagline.setFont(_home_font("tagline"))
+        tagline.setObjectName("home_tagline")
         
         hero_layout.addWidget(logo)
         hero_layout.addWidget(subtitle)
@@ -3,140 +3,441 @@ QID - Image Grid (Qt)
 Professional grid with cards and match percentages.
 """
 
-from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QScrollArea, QFrame, QGridLayout
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QFrame, QSizePolicy
+from PySide6.QtCore import (
+    Qt, Signal, QPropertyAnimation, QEasingCurve, QEvent,
+    QObject, QRunnable, QThreadPool, QRect, QPoint, QTimer
 )
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QPixmap, QFont, QCursor
+from PySide6.QtGui import (
+    QPixmap, QPixmapCache, QFont, QFontMetrics, QImage, QImageReader,
+    QPainter, QColor
+)
+from PIL import Image, ImageOps
 from pathlib import Path
+import hashlib
+import os
+import threading
+
+from .theme import get_font
+
+
+# Persistent thumbnail cache (one JPEG per (path, mtime, size))
+THUMB_CACHE_DIR = Path.home() / ".cache" / "qid" / "thumbs"
+THUMB_CACHE_MAX_FILES = 5000
+
+# In-memory L1 in front of the disk cache (QPixmapCache limit is in KB)
+THUMB_PIXMAP_CACHE_KB = 256 * 1024
+
+
+def _thumb_pixmap_key(image_path: str, mtime_ns: int, size: int) -> str:
+    """QPixmapCache key for a thumbnail; a changed mtime yields a new key."""
+    return f"{image_path}|{mtime_ns}|{size}"
+
+
+def _thumb_cache_path(image_path: str, mtime_ns: int, size: int) -> Path:
+    """Cache file for a thumbnail; a changed mtime yields a new key."""
+    key = hashlib.blake2b(
+        f"{image_path}|{mtime_ns}|{size}".encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+    return THUMB_CACHE_DIR / f"{key}.jpg"
+
+
+def _thumb_cache_get(image_path: str, mtime_ns: int, size: int):
+    """Load a cached thumbnail, or return None on a miss."""
+    cache_path = _thumb_cache_path(image_path, mtime_ns, size)
+    
+    image = QImage()
+    if not image.load(str(cache_path), "JPEG"):
+        return None
+    
+    # Refresh mtime so trimming evicts least recently used entries first
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    
+    return image
+
+
+def _thumb_cache_put(image_path: str, mtime_ns: int, size: int, image: QImage):
+    """Store a thumbnail in the cache (best effort)."""
+    if image.hasAlphaChannel():
+        # JPEG would flatten transparency to black
+        return
+    
+    cache_path = _thumb_cache_path(image_path, mtime_ns, size)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    
+    try:
+        THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if image.save(str(tmp_path), "JPEG", 85):
+            os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _trim_thumb_cache(max_files: int = THUMB_CACHE_MAX_FILES):
+    """Delete the least recently used thumbnails beyond max_files."""
+    try:
+        entries = [e for e in os.scandir(THUMB_CACHE_DIR) if e.is_file()]
+    except OSError:
+        return
+    
+    if len(entries) <= max_files:
+        return
+    
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[:len(entries) - max_files]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _to_pixmap_format(image: QImage) -> QImage:
+    """
+    Convert to the format QPixmap uses natively, so QPixmap.fromImage on
+    the GUI thread is a plain upload with no per-pixel conversion.
+    """
+    if image.isNull():
+        return image
+    
+    target = QImage.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format_RGB32
+    if image.format() == target:
+        return image
+    
+    return image.convertToFormat(target)
+
+
+# Placeholder glyph and color for thumbnails that failed to load
+PLACEHOLDER_GLYPHS = {
+    "missing": ("🚫", "#ffa726"),
+    "error": ("❌", "#ff5252"),
+}
+
+# (reason, size) -> QPixmap; built on first use (needs a QApplication)
+_placeholder_pixmaps = {}
+
+
+def _placeholder_pixmap(reason: str, size: int) -> QPixmap:
+    """Shared placeholder for a failed thumbnail, rendered once per size."""
+    key = (reason, size)
+    pixmap = _placeholder_pixmaps.get(key)
+    
+    if pixmap is None:
+        glyph, color = PLACEHOLDER_GLYPHS[reason]
+        
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        
+        font = QFont(get_font(24))
+        font.setPixelSize(32)
+        
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, glyph)
+        painter.end()
+        
+        _placeholder_pixmaps[key] = pixmap
+    
+    return pixmap
+
+
+# Stylesheet for the whole grid, parsed once instead of once per card
+GRID_QSS = """
+    QScrollArea {
+        border: none;
+        background: transparent;
+    }
+    #image_card {
+        background: rgba(21, 27, 45, 0.6);
+        border: 1px solid rgba(255, 255, 255, 0.08);
+        border-radius: 12px;
+    }
+    #image_card:hover {
+        background: rgba(21, 27, 45, 0.85);
+        border-color: rgba(79, 108, 255, 0.4);
+    }
+"""
+
+
+class ThumbnailSignals(QObject):
+    """Signals for ThumbnailLoader (QRunnable can't emit directly)."""
+    
+    done = Signal(int, int, QImage)  # generation, index, thumbnail
+    failed = Signal(int, int, str)   # generation, index, reason ("missing" / "error")
+
+
+class ThumbCacheTrimJob(QRunnable):
+    """
+    Trims the on-disk thumbnail cache on a worker thread, keeping the
+    directory scan off the GUI thread at startup.
+    """
+    
+    # Queued behind every thumbnail load (those use -row)
+    PRIORITY = -(2 ** 30)
+    
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(True)
+    
+    def run(self):
+        _trim_thumb_cache()
+
+
+class ThumbnailLoader(QRunnable):
+    """
+    Decodes and downscales one thumbnail on a worker thread.
+    
+    Results are delivered through queued signals, so the GUI thread
+    only has to wrap the finished QImage in a QPixmap.
+    """
+    
+    def __init__(self, grid, generation: int, index: int, image_path: str, mtime_ns: int, thumbnail_size: int):
+        super().__init__()
+        
+        self.grid = grid
+        self.generation = generation
+        self.index = index
+        self.image_path = image_path
+        self.mtime_ns = mtime_ns
+        self.thumbnail_size = thumbnail_size
+        self.signals = ThumbnailSignals()
+        
+        self.setAutoDelete(True)
+    
+    def run(self):
+        """Decode the image (skipped if the card was recycled meanwhile)."""
+        if not self.grid._wants_thumbnail(self.generation, self.index):
+            return
+        
+        # Cached thumbnail skips decoding and scaling entirely
+        image = _thumb_cache_get(self.image_path, self.mtime_ns, self.thumbnail_size)
+        if image is not None:
+            self.signals.done.emit(self.generation, self.index, image)
+            return
+        
+        image = self._decode_with_pillow()
+        if image is None:
+            image = self._decode_with_qt()
+        
+        if image.isNull():
+            self.signals.failed.emit(self.generation, self.index, "error")
+            return
+        
+        _thumb_cache_put(self.image_path, self.mtime_ns, self.thumbnail_size, image)
+        
+        self.signals.done.emit(self.generation, self.index, image)
+    
+    def _decode_with_pillow(self):
+        """
+        Decode via Pillow, letting libjpeg DCT-scale (draft) before a
+        LANCZOS thumbnail pass.
+        
+        Returns:
+            QImage, or None if Pillow can't read the file
+        """
+        s = self.thumbnail_size
+        
+        try:
+            with Image.open(self.image_path) as im:
+                # Decode JPEGs at 1/2, 1/4 or 1/8 scale when that's still >= 2x target
+                im.draft("RGB", (s * 2, s * 2))
+                im = ImageOps.exif_transpose(im)
+                im.thumbnail((s, s), Image.Resampling.LANCZOS)
+                
+                if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
+                    im = im.convert("RGBA")
+                    fmt, channels = QImage.Format_RGBA8888, 4
+                else:
+                    im = im.convert("RGB")
+                    fmt, channels = QImage.Format_RGB888, 3
+                
+                data = im.tobytes("raw", im.mode)
+                
+                # Converting detaches from `data` (freed after return) and
+                # yields the pixmap-native format in the same allocation
+                return _to_pixmap_format(QImage(data, im.width, im.height, im.width * channels, fmt))
+        except Exception:
+            return None
+    
+    def _decode_with_qt(self) -> QImage:
+        """Fallback decode via QImageReader for formats Pillow can't read."""
+        reader = QImageReader(self.image_path)
+        reader.setAutoTransform(True)
+        
+        # Let the decoder scale while decoding instead of decoding full
+        # resolution and scaling afterwards
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(
+                self.thumbnail_size, self.thumbnail_size, Qt.KeepAspectRatio
+            ))
+        
+        image = reader.read()
+        
+        # Some formats ignore setScaledSize
+        if image.width() > self.thumbnail_size or image.height() > self.thumbnail_size:
+            image = image.scaled(
+                self.thumbnail_size, self.thumbnail_size,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+        
+        return _to_pixmap_format(image)
 
 
 class ImageCard(QFrame):
     """
     Professional image card with hover effect.
+    
+    The frame (background, border, hover) is styled by GRID_QSS; the
+    thumbnail, filename and match badge are painted directly in
+    paintEvent() instead of through child labels.
+    
+    Cards are pooled by the grid; update_result() re-populates one for a
+    new result without rebuilding anything.
     """
     
-    clicked = Signal(dict, list, int)  # Emits (result, all_results, index)
+    clicked = Signal(dict, int)  # Emits (result, index)
+    
+    # Match badge color by minimum score (%)
+    SCORE_LEVELS = (
+        (80, QColor("#00ff94")),
+        (60, QColor("#ffa726")),
+        (float("-inf"), QColor("#8b92a8")),
+    )
+    
+    IMAGE_BACKGROUND = QColor(10, 14, 26, 128)
+    FILENAME_COLOR = QColor("#ffffff")
+    
+    MARGIN = 12
+    SPACING = 8
     
     def __init__(self, result: dict, thumbnail_size: int, index: int, parent=None):
         super().__init__(parent)
         
-        self.result = result
-        self.index = index
+        # Shared theme fonts (built once, see theme.get_font)
+        self._filename_font = get_font(11)
+        self._match_font = get_font(11, QFont.Bold)
         
         self.setObjectName("image_card")
-        self.setCursor(QCursor(Qt.PointingHandCursor))
+        self.setCursor(Qt.PointingHandCursor)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.setFixedSize(thumbnail_size + 24, thumbnail_size + 90)
         
-        # Card styling
-        self.setStyleSheet(f"""
-            #image_card {{
-                background: rgba(21, 27, 45, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-radius: 12px;
-            }}
-            #image_card:hover {{
-                background: rgba(21, 27, 45, 0.85);
-                border-color: rgba(79, 108, 255, 0.4);
-            }}
-        """)
-        
-        # Layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(8)
-        layout.setAlignment(Qt.AlignTop)
-        
-        # Image container
-        image_container = QLabel()
-        image_container.setFixedSize(thumbnail_size, thumbnail_size)
-        image_container.setAlignment(Qt.AlignCenter)
-        image_container.setStyleSheet("""
-            background: rgba(10, 14, 26, 0.5);
-            border-radius: 8px;
-        """)
-        
-        # Load and display image
-        image_path = result['file_path']
-        if Path(image_path).exists():
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                # Scale maintaining aspect ratio
-                scaled = pixmap.scaled(
-                    thumbnail_size, thumbnail_size,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                image_container.setPixmap(scaled)
-            else:
-                image_container.setText("❌")
-                image_container.setStyleSheet("""
-                    background: rgba(10, 14, 26, 0.5);
-                    border-radius: 8px;
-                    color: #ff5252;
-                    font-size: 32px;
-                """)
-        else:
-            image_container.setText("🚫")
-            image_container.setStyleSheet("""
-                background: rgba(10, 14, 26, 0.5);
-                border-radius: 8px;
-                color: #ffa726;
-                font-size: 32px;
-            """)
-        
-        layout.addWidget(image_container)
-        
-        # Info section
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(4)
+        self.thumbnail_size = thumbnail_size
+        
+        # Paint geometry, fixed for the card's lifetime
+        self._image_rect = QRect(self.MARGIN, self.MARGIN, thumbnail_size, thumbnail_size)
+        
+        filename_height = QFontMetrics(self._filename_font).height()
+        match_height = QFontMetrics(self._match_font).height()
+        
+        self._filename_rect = QRect(
+            self.MARGIN, self._image_rect.bottom() + 1 + self.SPACING,
+            thumbnail_size, filename_height
+        )
+        self._match_rect = QRect(
+            self.MARGIN, self._filename_rect.bottom() + 1 + 4,
+            thumbnail_size, match_height
+        )
+        
+        self.update_result(result, index)
+    
+    def update_result(self, result: dict, index: int):
+        """
+        Show a different result in this card.
+        
+        Only the dynamic parts change: the thumbnail goes back to an empty
+        placeholder and the filename and match text are recomputed.
+        """
+        self.result = result
+        self.index = index
+        
+        self._pixmap = None
+        
+        # Elide once here rather than on every repaint
+        self._name = QFontMetrics(self._filename_font).elidedText(
+            result['file_name'], Qt.ElideRight, self._filename_rect.width()
+        )
         
-        # Filename
-        filename = QLabel(result['file_name'])
-        filename.setWordWrap(True)
-        filename.setMaximumWidth(thumbnail_size)
-        font = QFont("Inter, Segoe UI", 11)
-        filename.setFont(font)
-        filename.setStyleSheet("color: #ffffff;")
-        
-        # Match percentage with badge
         score = result['score'] * 100
+        self._score_color = next(color for threshold, color in self.SCORE_LEVELS if score >= threshold)
+        self._match_text = f"● {score:.0f}% Match"
         
-        # Color based on score
-        if score >= 80:
-            badge_color = "#00ff94"  # Green
-        elif score >= 60:
-            badge_color = "#ffa726"  # Orange
-        else:
-            badge_color = "#8b92a8"  # Gray
+        self.update()
+    
+    def set_thumbnail(self, pixmap: QPixmap):
+        """Show a thumbnail (already at display size; no rescale)."""
+        self._pixmap = pixmap
+        self.update(self._image_rect)
+    
+    def set_failed(self, reason: str):
+        """Show a placeholder for a missing or unreadable image."""
+        self._pixmap = _placeholder_pixmap(
+            "missing" if reason == "missing" else "error", self.thumbnail_size
+        )
+        self.update(self._image_rect)
+    
+    def paintEvent(self, event):
+        """Paint the styled frame, then the thumbnail and info text."""
+        super().paintEvent(event)
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Image area
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.IMAGE_BACKGROUND)
+        painter.drawRoundedRect(self._image_rect, 8, 8)
         
-        match_label = QLabel(f"● {score:.0f}% Match")
-        font = QFont("Inter, Segoe UI", 11, QFont.Bold)
-        match_label.setFont(font)
-        match_label.setStyleSheet(f"color: {badge_color};")
+        if self._pixmap is not None:
+            # Center the (aspect-preserved) thumbnail or placeholder in the square area
+            target = QRect(QPoint(0, 0), self._pixmap.size())
+            target.moveCenter(self._image_rect.center())
+            painter.drawPixmap(target, self._pixmap)
         
-        info_layout.addWidget(filename)
-        info_layout.addWidget(match_label)
+        # Filename
+        painter.setFont(self._filename_font)
+        painter.setPen(self.FILENAME_COLOR)
+        painter.drawText(self._filename_rect, Qt.AlignLeft | Qt.AlignVCenter, self._name)
+        
+        # Match percentage
+        painter.setFont(self._match_font)
+        painter.setPen(self._score_color)
+        painter.drawText(self._match_rect, Qt.AlignLeft | Qt.AlignVCenter, self._match_text)
         
-        layout.addLayout(info_layout)
+        painter.end()
     
     def mousePressEvent(self, event):
         """Handle click."""
         if event.button() == Qt.LeftButton:
-            # Emit result, all_results, and index for viewer
-            self.clicked.emit(self.result, [], self.index)
+            # The grid adds all_results for viewer navigation
+            self.clicked.emit(self.result, self.index)
         super().mousePressEvent(event)
 
 
 class ImageGridQt(QWidget):
     """
     Scrollable grid of image cards.
+    
+    The grid is virtualized: cards only exist for the rows intersecting
+    the viewport (plus OVERSCAN_ROWS above and below) and are recycled
+    as the user scrolls.
     """
     
     # Signal for image click with navigation support
     image_clicked = Signal(dict, list, int)  # result, all_results, index
     
+    SPACING = 16
+    OVERSCAN_ROWS = 1
+    UPDATE_DELAY_MS = 24
+    
     def __init__(self, columns: int = 4, thumbnail_size: int = 200, parent=None):
         super().__init__(parent)
         
@@ -144,54 +445,229 @@ class ImageGridQt(QWidget):
         self.thumbnail_size = thumbnail_size
         self.results = []
         
+        # Card geometry (must match ImageCard.setFixedSize)
+        self.card_width = thumbnail_size + 24
+        self.card_height = thumbnail_size + 90
+        self.grid_width = columns * (self.card_width + self.SPACING) - self.SPACING
+        
+        # All cards ever created; _bound maps result index -> card for the
+        # cards currently on screen, the rest are hidden and free for reuse
+        self._card_pool = []
+        self._bound = {}
+        
+        self.setStyleSheet(GRID_QSS)
+        
+        # Bumped on every new result set; stale thumbnail loads check it
+        self._generation = 0
+        
+        QPixmapCache.setCacheLimit(THUMB_PIXMAP_CACHE_KB)
+        
+        # QPixmapCache key of the thumbnail being loaded, per bound index
+        self._thumb_keys = {}
+        
+        # Decoding is CPU bound; more workers than cores only adds
+        # half-decoded images in flight. A pool of our own, so the limit
+        # doesn't change the global pool the indexer and viewer share
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_pool.setMaxThreadCount(os.cpu_count() or 1)
+        
+        # Keep the on-disk thumbnail cache bounded, in the background
+        self._thumb_pool.start(ThumbCacheTrimJob(), ThumbCacheTrimJob.PRIORITY)
+        
+        # display_results() calls arriving in quick succession are
+        # coalesced into a single rebuild
+        self._pending_results = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_DELAY_MS)
+        self._update_timer.timeout.connect(self._apply_pending)
+        
         # Main layout
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
         # Scroll area
         self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setWidgetResizable(False)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-        """)
-        
-        # Grid container
+        
+        # Grid container (cards are positioned manually, no layout). Its
+        # size is computed from the result count, so Qt never has to ask
+        # for a sizeHint; the scroll area centers it horizontally
         self.grid_widget = QWidget()
-        self.grid_layout = QGridLayout(self.grid_widget)
-        self.grid_layout.setSpacing(16)
-        self.grid_layout.setContentsMargins(0, 0, 0, 0)
-        self.grid_layout.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
+        self.grid_widget.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.grid_widget.setFixedSize(self.grid_width, 0)
+        self.scroll_area.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
         
         self.scroll_area.setWidget(self.grid_widget)
         main_layout.addWidget(self.scroll_area)
+        
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._refresh_visible)
+        self.scroll_area.viewport().installEventFilter(self)
     
     def display_results(self, results: list):
         """
         Display search results in grid.
+        
+        The rebuild is deferred by UPDATE_DELAY_MS so a burst of calls
+        only rebuilds once, with the last results.
         """
-        # Clear existing
-        self.clear()
+        if results is self._pending_results:
+            return
+        if results is self.results and not self._update_timer.isActive():
+            return
+        
+        self._pending_results = results
+        self._update_timer.start()
+    
+    def _apply_pending(self):
+        """Rebuild the grid for the latest results passed to display_results()."""
+        results = self._pending_results
+        self._pending_results = None
+        if results is None:
+            return
+        
+        # Cancel thumbnail loads still queued for the previous results
+        self._generation += 1
         
         self.results = results
         
-        # Add cards to grid
-        for i, result in enumerate(results):
-            row = i // self.columns
-            col = i % self.columns
-            
-            card = ImageCard(result, self.thumbnail_size, i)
-            card.clicked.connect(self._on_image_clicked)
-            
-            self.grid_layout.addWidget(card, row, col)
+        # Release every card; _refresh_visible binds what's on screen
+        for card in self._bound.values():
+            card.setVisible(False)
+        self._bound = {}
+        self._thumb_keys = {}
+        
+        rows = (len(results) + self.columns - 1) // self.columns
+        height = rows * (self.card_height + self.SPACING) - self.SPACING if rows else 0
+        self.grid_widget.setFixedSize(self.grid_width, height)
         
         # Scroll to top
         self.scroll_area.verticalScrollBar().setValue(0)
+        
+        self._refresh_visible()
+    
+    def _visible_range(self) -> range:
+        """Indices of results whose rows intersect the viewport (+ overscan)."""
+        if not self.results:
+            return range(0)
+        
+        pitch = self.card_height + self.SPACING
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + self.scroll_area.viewport().height()
+        
+        rows = (len(self.results) + self.columns - 1) // self.columns
+        first_row = max(0, top // pitch - self.OVERSCAN_ROWS)
+        last_row = min(rows - 1, bottom // pitch + self.OVERSCAN_ROWS)
+        
+        return range(first_row * self.columns, min((last_row + 1) * self.columns, len(self.results)))
+    
+    def _card_position(self, index: int):
+        """Top-left corner of the card for result index."""
+        row = index // self.columns
+        col = index % self.columns
+        
+        return (
+            col * (self.card_width + self.SPACING),
+            row * (self.card_height + self.SPACING)
+        )
+    
+    def _refresh_visible(self):
+        """Bind cards to the visible results and recycle the rest."""
+        wanted = self._visible_range()
+        
+        # Rebind everything, then repaint once
+        self.grid_widget.setUpdatesEnabled(False)
+        try:
+            self._bind_cards(wanted)
+        finally:
+            self.grid_widget.setUpdatesEnabled(True)
     
-    def _on_image_clicked(self, result: dict, all_results: list, index: int):
+    def _bind_cards(self, wanted: range):
+        """Recycle cards outside `wanted` and bind cards to indices inside it."""
+        # Release cards that scrolled out of range
+        for index in [i for i in self._bound if i not in wanted]:
+            self._bound.pop(index).setVisible(False)
+            self._thumb_keys.pop(index, None)
+        
+        bound = set(self._bound.values())
+        free = [card for card in self._card_pool if card not in bound]
+        
+        for index in wanted:
+            if index in self._bound:
+                continue
+            
+            result = self.results[index]
+            if free:
+                card = free.pop()
+                card.update_result(result, index)
+            else:
+                card = ImageCard(result, self.thumbnail_size, index, self.grid_widget)
+                card.clicked.connect(self._on_image_clicked)
+                self._card_pool.append(card)
+            
+            card.move(*self._card_position(index))
+            card.setVisible(True)
+            self._bound[index] = card
+            
+            self._load_thumbnail(index, result['file_path'])
+    
+    def eventFilter(self, obj, event):
+        """On viewport resize, bind rows that came into view."""
+        if obj is self.scroll_area.viewport() and event.type() == QEvent.Resize:
+            self._refresh_visible()
+        
+        return super().eventFilter(obj, event)
+    
+    def _load_thumbnail(self, index: int, image_path: str):
+        """
+        Show the thumbnail for the card at index, from QPixmapCache if
+        possible, otherwise via a background decode.
+        """
+        try:
+            mtime_ns = os.stat(image_path).st_mtime_ns
+        except OSError:
+            self._bound[index].set_failed("missing")
+            return
+        
+        key = _thumb_pixmap_key(image_path, mtime_ns, self.thumbnail_size)
+        
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            self._bound[index].set_thumbnail(pixmap)
+            return
+        
+        self._thumb_keys[index] = key
+        
+        loader = ThumbnailLoader(self, self._generation, index, image_path, mtime_ns, self.thumbnail_size)
+        loader.signals.done.connect(self._on_thumbnail_loaded)
+        loader.signals.failed.connect(self._on_thumbnail_failed)
+        
+        # Top rows first; loads for released cards bail out in run()
+        self._thumb_pool.start(loader, -(index // self.columns))
+    
+    def _wants_thumbnail(self, generation: int, index: int) -> bool:
+        """Whether a thumbnail load is still needed (checked from workers too)."""
+        return generation == self._generation and index in self._bound
+    
+    def _on_thumbnail_loaded(self, generation: int, index: int, image: QImage):
+        """Apply a finished thumbnail (GUI thread)."""
+        if self._wants_thumbnail(generation, index):
+            pixmap = QPixmap.fromImage(image)
+            # A card scrolled out and back in can have two loads finish in
+            # the same generation; only the first one has a key left
+            key = self._thumb_keys.pop(index, None)
+            if key is not None:
+                QPixmapCache.insert(key, pixmap)
+            self._bound[index].set_thumbnail(pixmap)
+    
+    def _on_thumbnail_failed(self, generation: int, index: int, reason: str):
+        """Show a placeholder for a thumbnail that couldn't be loaded."""
+        if self._wants_thumbnail(generation, index):
+            self._thumb_keys.pop(index, None)
+            self._bound[index].set_failed(reason)
+    
+    def _on_image_clicked(self, result: dict, index: int):
         """
         Handle image click - emit with all results for navigation.
         """
@@ -199,12 +675,19 @@ class ImageGridQt(QWidget):
         self.image_clicked.emit(result, self.results, index)
     
     def clear(self):
-        """Clear all cards."""
-        # Remove all widgets from grid
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        """Clear all cards (they are hidden and kept for reuse)."""
+        # Drop a rebuild that hasn't happened yet
+        self._update_timer.stop()
+        self._pending_results = None
+        
+        # Cancel thumbnail loads still queued for the old cards
+        self._generation += 1
+        
+        for card in self._bound.values():
+            card.setVisible(False)
+        self._bound = {}
+        self._thumb_keys = {}
+        
+        self.grid_widget.setFixedSize(self.grid_width, 0)
         
         self.results = []
\ No newline at end of file
@@ -4,17 +4,126 @@ Beautiful lightbox for viewing images in-app with fullscreen and file location a
 """
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFrame, QWidget, QGraphicsDropShadowEffect
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QPushButton, QFrame, QWidget, QSizePolicy
+)
+from PySide6.QtCore import (
+    Qt, Signal, QPoint, QRect, QSize, QTimer, QObject, QRunnable, QThreadPool,
+    QProcess
+)
+from PySide6.QtGui import (
+    QPixmap, QPixmapCache, QImage, QImageReader, QImageIOHandler, QIcon, QFont, QKeyEvent, QMouseEvent,
+    QPainter, QColor, QPen
 )
-from PySide6.QtCore import Qt, Signal, QPoint
-from PySide6.QtGui import QPixmap, QFont, QKeyEvent, QMouseEvent
 from PySide6.QtWidgets import QStyle
 from pathlib import Path
-import subprocess
+import os
 import platform
 
-from .theme import COLORS
+from .theme import COLORS, get_font
+
+
+# "Open File Location" for this OS, picked once at import (startDetached
+# returns as soon as the process is spawned instead of blocking the GUI)
+if platform.system() == "Windows":
+    def _reveal(file_path: Path):
+        """Windows: open Explorer and select the file."""
+        QProcess.startDetached("explorer", [f"/select,{file_path}"])
+elif platform.system() == "Darwin":
+    def _reveal(file_path: Path):
+        """macOS: open Finder and select the file."""
+        QProcess.startDetached("open", ["-R", str(file_path)])
+else:
+    def _reveal(file_path: Path):
+        """Linux: just open the directory."""
+        QProcess.startDetached("xdg-open", [str(file_path.parent)])
+
+
+# Stylesheet for the whole viewer, parsed once on ImageViewerQt instead of
+# once per widget
+VIEWER_QSS = f"""
+    #viewer_container {{
+        background: rgba(10, 14, 26, 0.98);
+        border-radius: 0px;
+    }}
+    ViewerTitleBar {{
+        background: {COLORS['background_elevated']};
+        border-bottom: 1px solid {COLORS['border']};
+    }}
+    QLabel#viewer_title {{
+        color: {COLORS['text_primary']};
+        background: transparent;
+    }}
+    QLabel#match_badge {{
+        background: {COLORS['success']};
+        color: {COLORS['background']};
+        border-radius: 8px;
+        padding: 0 16px;
+    }}
+    QLabel#match_badge[grade="good"] {{
+        background: {COLORS['success']};
+    }}
+    QLabel#match_badge[grade="ok"] {{
+        background: #ffa726;
+    }}
+    QLabel#match_badge[grade="bad"] {{
+        background: {COLORS['text_secondary']};
+    }}
+    QPushButton#nav_button {{
+        background: transparent;
+        border: 1px solid {COLORS['border']};
+        border-radius: 8px;
+        padding: 0 16px;
+        color: {COLORS['text_secondary']};
+    }}
+    QPushButton#nav_button:hover {{
+        background: {COLORS['background_hover']};
+        color: {COLORS['text_primary']};
+    }}
+    QPushButton#nav_button:disabled {{
+        color: {COLORS['text_tertiary']};
+        border-color: {COLORS['text_tertiary']};
+    }}
+    QPushButton#location_button {{
+        background: {COLORS['primary']};
+        border: none;
+        border-radius: 8px;
+        padding: 0 16px;
+        color: white;
+    }}
+    QPushButton#location_button:hover {{
+        background: {COLORS['primary_hover']};
+    }}
+    QPushButton#control_button, QPushButton#close_btn {{
+        background: transparent;
+        border: none;
+        border-radius: 6px;
+        color: {COLORS['text_primary']};
+    }}
+    QPushButton#control_button:hover {{
+        background: {COLORS['background_hover']};
+        color: white;
+    }}
+    QPushButton#close_btn:hover {{
+        background: #ff4d4f;
+        color: white;
+    }}
+    QFrame#image_area {{
+        background: transparent;
+    }}
+    QFrame#info_bar {{
+        background: {COLORS['background_elevated']};
+        border-top: 1px solid {COLORS['border']};
+    }}
+    QLabel#viewer_filename {{
+        color: {COLORS['text_primary']};
+        background: transparent;
+    }}
+    QLabel#viewer_resolution {{
+        color: {COLORS['text_secondary']};
+        background: transparent;
+    }}
+"""
 
 
 class ViewerTitleBar(QWidget):
@@ -27,16 +136,20 @@ class ViewerTitleBar(QWidget):
     maximize_clicked = Signal()
     close_clicked = Signal()
     
+    # Native icons per control role, shared by all title bars
+    ICON_ROLES = {
+        "min": QStyle.SP_TitleBarMinButton,
+        "max": QStyle.SP_TitleBarMaxButton,
+        "close": QStyle.SP_TitleBarCloseButton,
+    }
+    _icons = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self.setFixedHeight(60)
-        self.setStyleSheet(f"""
-            ViewerTitleBar {{
-                background: {COLORS['background_elevated']};
-                border-bottom: 1px solid {COLORS['border']};
-            }}
-        """)
+        
+        # Styling comes from VIEWER_QSS on the viewer
         
         # For window dragging
         self.drag_position = QPoint()
@@ -56,9 +169,8 @@ class ViewerTitleBar(QWidget):
         left_layout.setSpacing(0)
         
         self.title_label = QLabel("Preview Mode")
-        font = QFont("Inter, Segoe UI", 14, QFont.Bold)
-        self.title_label.setFont(font)
-        self.title_label.setStyleSheet(f"color: {COLORS['text_primary']}; background: transparent;")
+        self.title_label.setFont(get_font(14, QFont.Bold))
+        self.title_label.setObjectName("viewer_title")
         
         left_layout.addWidget(self.title_label)
         left_layout.addStretch()
@@ -72,65 +184,29 @@ class ViewerTitleBar(QWidget):
         
         # Match badge
         self.match_badge = QLabel("98.4% Match")
-        font = QFont("Inter, Segoe UI", 11, QFont.Bold)
-        self.match_badge.setFont(font)
+        self.match_badge.setFont(get_font(11, QFont.Bold))
         self.match_badge.setFixedHeight(36)
-        self.match_badge.setStyleSheet(f"""
-            background: {COLORS['success']};
-            color: {COLORS['background']};
-            border-radius: 8px;
-            padding: 0 16px;
-        """)
+        self.match_badge.setObjectName("match_badge")
         
         # Navigation buttons
         self.prev_button = QPushButton("◀ Previous")
         self.prev_button.setCursor(Qt.PointingHandCursor)
         self.prev_button.setFixedHeight(36)
-        font = QFont("Inter, Segoe UI", 11)
-        self.prev_button.setFont(font)
-        self.prev_button.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 0 16px;
-                color: {COLORS['text_secondary']};
-            }}
-            QPushButton:hover {{
-                background: {COLORS['background_hover']};
-                color: {COLORS['text_primary']};
-            }}
-            QPushButton:disabled {{
-                color: {COLORS['text_tertiary']};
-                border-color: {COLORS['text_tertiary']};
-            }}
-        """)
+        self.prev_button.setFont(get_font(11))
+        self.prev_button.setObjectName("nav_button")
         
         self.next_button = QPushButton("Next ▶")
         self.next_button.setCursor(Qt.PointingHandCursor)
         self.next_button.setFixedHeight(36)
-        font = QFont("Inter, Segoe UI", 11)
-        self.next_button.setFont(font)
-        self.next_button.setStyleSheet(self.prev_button.styleSheet())
+        self.next_button.setFont(get_font(11))
+        self.next_button.setObjectName("nav_button")
         
         # Open File Location button
         self.location_btn = QPushButton("📁 Open File Location")
         self.location_btn.setCursor(Qt.PointingHandCursor)
         self.location_btn.setFixedHeight(36)
-        font = QFont("Inter, Segoe UI", 11, QFont.Bold)
-        self.location_btn.setFont(font)
-        self.location_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {COLORS['primary']};
-                border: none;
-                border-radius: 8px;
-                padding: 0 16px;
-                color: white;
-            }}
-            QPushButton:hover {{
-                background: {COLORS['primary_hover']};
-            }}
-        """)
+        self.location_btn.setFont(get_font(11, QFont.Bold))
+        self.location_btn.setObjectName("location_button")
         
         center_layout.addWidget(self.match_badge)
         center_layout.addWidget(self.prev_button)
@@ -161,42 +237,27 @@ class ViewerTitleBar(QWidget):
         layout.addWidget(center_cluster, stretch=1)
         layout.addWidget(right_cluster, stretch=1)
     
+    @classmethod
+    def _icon(cls, role: str) -> QIcon:
+        """Native title bar icon for a control role, looked up once per process."""
+        icon = cls._icons.get(role)
+        if icon is None:
+            icon = cls._icons[role] = QApplication.style().standardIcon(cls.ICON_ROLES[role])
+        return icon
+    
     def _create_control_button(self, role: str) -> QPushButton:
         """Create window control button."""
         btn = QPushButton()
         btn.setCursor(Qt.PointingHandCursor)
         btn.setFixedSize(40, 40)
         
-        font = QFont("Inter, Segoe UI", 14, QFont.Bold)
-        btn.setFont(font)
+        btn.setFont(get_font(14, QFont.Bold))
         
         # Assign native system icons
-        if role == "min":
-            btn.setIcon(self.style().standardIcon(QStyle.SP_TitleBarMinButton))
-        elif role == "max":
-            btn.setIcon(self.style().standardIcon(QStyle.SP_TitleBarMaxButton))
-        elif role == "close":
-            btn.setIcon(self.style().standardIcon(QStyle.SP_TitleBarCloseButton))
-            btn.setObjectName("close_btn")
-        
-        # Styles
-        base_style = f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                border-radius: 6px;
-                color: {COLORS['text_primary']};
-            }}
-            QPushButton:hover {{
-                background: {{hover_color}};
-                color: white;
-            }}
-        """
+        btn.setIcon(self._icon(role))
         
-        if role == "close":
-            btn.setStyleSheet(base_style.replace("{hover_color}", "#ff4d4f"))
-        else:
-            btn.setStyleSheet(base_style.replace("{hover_color}", COLORS['background_hover']))
+        # Styles (VIEWER_QSS)
+        btn.setObjectName("close_btn" if role == "close" else "control_button")
         
         return btn
     
@@ -213,6 +274,203 @@ class ViewerTitleBar(QWidget):
             event.accept()
 
 
+def _read_image_size(reader: QImageReader) -> QSize:
+    """Size of the image as displayed (after EXIF rotation), from the header only."""
+    size = reader.size()
+    if size.isValid() and reader.transformation() & QImageIOHandler.TransformationRotate90:
+        size.transpose()
+    return size
+
+
+class ImageDecodeSignals(QObject):
+    """Signals for ImageDecodeJob (QRunnable can't emit directly)."""
+    
+    finished = Signal(str, list, QSize)  # path, mip levels (empty on failure), original size
+
+
+class ImageDecodeJob(QRunnable):
+    """
+    Decodes an image on a worker thread, at no more than max_size, and
+    builds its mip chain (each level half the size of the previous).
+    
+    The QImages come back through a queued signal; only the QPixmap
+    conversion happens on the GUI thread.
+    """
+    
+    MIP_LEVELS = 4
+    MIP_MIN_SIZE = 64
+    
+    def __init__(self, image_path: str, max_size: QSize):
+        super().__init__()
+        
+        self.image_path = image_path
+        self.max_size = max_size
+        self.signals = ImageDecodeSignals()
+    
+    def run(self):
+        """Decode the image, letting the decoder downscale (JPEG: DCT scaling)."""
+        reader = QImageReader(self.image_path)
+        reader.setAutoTransform(True)
+        
+        # Header-only; scaled size applies before auto-transform rotation
+        stored_size = reader.size()
+        if stored_size.isValid() and (
+            stored_size.width() > self.max_size.width() or stored_size.height() > self.max_size.height()
+        ):
+            reader.setScaledSize(stored_size.scaled(self.max_size, Qt.KeepAspectRatio))
+        
+        # The size before downscaling is what the viewer reports
+        src_size = _read_image_size(reader)
+        
+        image = reader.read()
+        
+        mips = []
+        if not image.isNull():
+            # All scaling stays on this QImage in the 32-bit format that
+            # smooth scaling and QPixmap use natively, so neither the mip
+            # passes nor QPixmap.fromImage on the GUI thread convert pixels
+            native = QImage.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format_RGB32
+            if image.format() != native:
+                image = image.convertToFormat(native)
+            
+            mips.append(image)
+            while len(mips) < self.MIP_LEVELS and min(image.width(), image.height()) >= 2 * self.MIP_MIN_SIZE:
+                image = image.scaled(image.width() // 2, image.height() // 2, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                mips.append(image)
+        
+        self.signals.finished.emit(self.image_path, mips, src_size)
+
+
+class ImageCanvas(QWidget):
+    """
+    Shows a pixmap scaled to fit (aspect preserved), scaling at paint time.
+    
+    The image is set once as a mip chain (full size first, then halves);
+    resizes only repaint, always scaling from the smallest level that is
+    still at least the target size. While resizing, the painter scales
+    that level directly (no filtering, no new pixmap); once resizing
+    stops, one smooth copy is made for the current size and reused until
+    the size changes again.
+    """
+    
+    # One smooth render follows once resizing has stopped for this long
+    RESIZE_DEBOUNCE_MS = 120
+    
+    # Frame drawn around the image (was the image QLabel's border + padding)
+    FRAME_PADDING = 8
+    FRAME_PEN = QPen(QColor(255, 255, 255, 25), 2)
+    MESSAGE_COLOR = QColor(COLORS['text_secondary'])
+    # Dims the previous image while the next one is being decoded
+    LOADING_DIM = QColor(0, 0, 0, 150)
+    LOADING_TEXT = "Loading…"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self._mips = []
+        self._fitted = None
+        self._message = ""
+        self._loading = False
+        
+        margin = self.FRAME_PADDING + 2
+        self.setContentsMargins(margin, margin, margin, margin)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        
+        self._resizing = False
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._render_hq)
+    
+    def set_mips(self, mips: list):
+        """Show a new image, given as its mip chain (list of QPixmap, largest first)."""
+        self._mips = mips
+        self._fitted = None
+        self._message = ""
+        self._loading = False
+        self.update()
+    
+    def set_message(self, message: str):
+        """Show a text message instead of an image."""
+        self._mips = []
+        self._fitted = None
+        self._message = message
+        self._loading = False
+        self.update()
+    
+    def set_loading(self, loading: bool):
+        """Dim the current image (or show a placeholder) while the next one loads."""
+        if loading != self._loading:
+            self._loading = loading
+            self.update()
+    
+    def _target_rect(self) -> QRect:
+        """Aspect-fit rectangle for the image, centered in the contents rect."""
+        area = self.contentsRect()
+        rect = QRect(QPoint(0, 0), self._mips[0].size().scaled(area.size(), Qt.KeepAspectRatio))
+        rect.moveCenter(area.center())
+        return rect
+    
+    def _mip_for(self, size: QSize) -> QPixmap:
+        """Smallest mip level that is at least `size` (the full image if none is)."""
+        for mip in reversed(self._mips):
+            if mip.width() >= size.width() and mip.height() >= size.height():
+                return mip
+        return self._mips[0]
+    
+    def resizeEvent(self, event):
+        """Repaint cheaply while resizing; smooth once resizing settles."""
+        super().resizeEvent(event)
+        
+        # Re-fired with identical geometry (e.g. maximize/restore): keep
+        # the smooth copy as it is
+        if event.size() == event.oldSize():
+            return
+        
+        self._resizing = True
+        self._resize_timer.start()
+    
+    def _render_hq(self):
+        """Switch back to smooth rendering after resizing has stopped."""
+        self._resizing = False
+        self.update()
+    
+    def paintEvent(self, event):
+        """Paint the fitted image and its frame (or the message)."""
+        painter = QPainter(self)
+        
+        if not self._mips:
+            message = self.LOADING_TEXT if self._loading else self._message
+            if message:
+                painter.setPen(self.MESSAGE_COLOR)
+                painter.drawText(self.rect(), Qt.AlignCenter, message)
+            return
+        
+        target = self._target_rect()
+        source = self._mip_for(target.size())
+        
+        if self._resizing:
+            # Unfiltered painter scaling; replaced by the smooth copy below
+            painter.drawPixmap(target, source)
+        else:
+            if self._fitted is None or self._fitted.size() != target.size():
+                self._fitted = source.scaled(target.size(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            painter.drawPixmap(target.topLeft(), self._fitted)
+        
+        pad = self.FRAME_PADDING + 1
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self.FRAME_PEN)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(target.adjusted(-pad, -pad, pad, pad), 12, 12)
+        
+        if self._loading:
+            # The labels already describe the next image; don't let this
+            # one pass for it
+            painter.fillRect(target, self.LOADING_DIM)
+            painter.setPen(self.MESSAGE_COLOR)
+            painter.drawText(target, Qt.AlignCenter, self.LOADING_TEXT)
+
+
 class ImageViewerQt(QDialog):
     """
     Lightbox image viewer with navigation and file location access.
@@ -222,6 +480,12 @@ class ImageViewerQt(QDialog):
     next_image = Signal()
     prev_image = Signal()
     
+    # Decoded mip levels live in the process-wide QPixmapCache under
+    # "qid-src::<path>::<level>", so Qt bounds them together with the grid
+    # thumbnails and they survive reopening the viewer. Original sizes
+    # (for the resolution label) are kept alongside, per path
+    _src_sizes = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -229,12 +493,21 @@ class ImageViewerQt(QDialog):
         self.all_results = []
         self.current_index = 0
         
+        # path -> exists, checked once per show_image()
+        self._path_exists_cache = {}
+        
+        # Source currently on the canvas, and paths being decoded
+        self._last_loaded_path = None
+        self._decoding = set()
+        
         # Dialog setup - Frameless
         self.setWindowTitle("Image Preview")
         self.setModal(True)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
+        self.setStyleSheet(VIEWER_QSS)
+        
         self._create_ui()
         
         # Install event filter for keyboard
@@ -245,19 +518,6 @@ class ImageViewerQt(QDialog):
         # Main container
         main_container = QWidget()
         main_container.setObjectName("viewer_container")
-        main_container.setStyleSheet(f"""
-            #viewer_container {{
-                background: rgba(10, 14, 26, 0.98);
-                border-radius: 0px;
-            }}
-        """)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(30)
-        shadow.setColor(Qt.black)
-        shadow.setOffset(0, 0)
-        main_container.setGraphicsEffect(shadow)
         
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -285,33 +545,22 @@ class ImageViewerQt(QDialog):
         
         # Image display area (center)
         image_container = QFrame()
-        image_container.setStyleSheet("background: transparent;")
+        image_container.setObjectName("image_area")
         
         image_layout = QVBoxLayout(image_container)
-        image_layout.setAlignment(Qt.AlignCenter)
         
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setStyleSheet("""
-            border: 2px solid rgba(255, 255, 255, 0.1);
-            border-radius: 12px;
-            padding: 8px;
-            background: transparent;
-        """)
+        # Scales at paint time; resizes never build a new pixmap here
+        self.image_canvas = ImageCanvas()
+        self.image_canvas.setFont(get_font(16))
         
-        image_layout.addWidget(self.image_label)
+        image_layout.addWidget(self.image_canvas)
         
         container_layout.addWidget(image_container, stretch=1)
         
         # Bottom info bar
         bottom_bar = QFrame()
         bottom_bar.setFixedHeight(80)
-        bottom_bar.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['background_elevated']};
-                border-top: 1px solid {COLORS['border']};
-            }}
-        """)
+        bottom_bar.setObjectName("info_bar")
         
         bottom_layout = QVBoxLayout(bottom_bar)
         bottom_layout.setAlignment(Qt.AlignCenter)
@@ -319,15 +568,13 @@ class ImageViewerQt(QDialog):
         
         # Filename
         self.filename_label = QLabel("")
-        font = QFont("Inter, Segoe UI", 13, QFont.Bold)
-        self.filename_label.setFont(font)
-        self.filename_label.setStyleSheet(f"color: {COLORS['text_primary']}; background: transparent;")
+        self.filename_label.setFont(get_font(13, QFont.Bold))
+        self.filename_label.setObjectName("viewer_filename")
         
         # Resolution
         self.resolution_label = QLabel("")
-        font = QFont("Inter, Segoe UI", 11)
-        self.resolution_label.setFont(font)
-        self.resolution_label.setStyleSheet(f"color: {COLORS['text_secondary']}; background: transparent;")
+        self.resolution_label.setFont(get_font(11))
+        self.resolution_label.setObjectName("viewer_resolution")
         
         bottom_layout.addWidget(self.filename_label)
         bottom_layout.addWidget(self.resolution_label)
@@ -354,6 +601,9 @@ class ImageViewerQt(QDialog):
         self.all_results = all_results or [result]
         self.current_index = index
         
+        # Opening the viewer re-checks files that may have moved since
+        self._path_exists_cache.clear()
+        
         # Update navigation buttons
         self.title_bar.prev_button.setEnabled(index > 0)
         self.title_bar.next_button.setEnabled(index < len(self.all_results) - 1)
@@ -365,64 +615,151 @@ class ImageViewerQt(QDialog):
         self.showMaximized()
     
     def _load_current_image(self):
-        """Load the current image into the viewer."""
+        """
+        Show the current image: from the source cache if possible,
+        otherwise decoded in the background (the previous image stays up,
+        dimmed, until the new one is ready).
+        """
         result = self.current_result
         image_path = result['file_path']
         
-        if Path(image_path).exists():
-            pixmap = QPixmap(image_path)
-            
-            if not pixmap.isNull():
-                # Get available space (accounting for top/bottom bars)
-                available_width = self.width() - 100 if self.width() > 100 else 1000
-                available_height = self.height() - 200 if self.height() > 200 else 800
-                
-                # Scale to fit screen while maintaining aspect ratio
-                scaled = pixmap.scaled(
-                    available_width,
-                    available_height,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                
-                self.image_label.setPixmap(scaled)
-                
-                # Update info
-                self.filename_label.setText(result['file_name'])
-                self.resolution_label.setText(f"{pixmap.width()} × {pixmap.height()} px")
-                
-                # Update match badge
-                score = result['score'] * 100
-                if score >= 80:
-                    badge_color = COLORS['success']
-                elif score >= 60:
-                    badge_color = "#ffa726"
-                else:
-                    badge_color = COLORS['text_secondary']
-                
-                self.title_bar.match_badge.setText(f"{score:.1f}% Match")
-                self.title_bar.match_badge.setStyleSheet(f"""
-                    background: {badge_color};
-                    color: {COLORS['background']};
-                    border-radius: 8px;
-                    padding: 0 16px;
-                    font-weight: bold;
-                """)
-                
-                # Update title
-                self.title_bar.title_label.setText(f"Preview Mode • {self.current_index + 1} of {len(self.all_results)}")
-            else:
+        if not self._path_exists(image_path):
+            self._show_error("Image file not found")
+            return
+        
+        # Update info
+        self.filename_label.setText(result['file_name'])
+        
+        # Update match badge (color comes from its grade in VIEWER_QSS)
+        score = result['score'] * 100
+        if score >= 80:
+            grade = "good"
+        elif score >= 60:
+            grade = "ok"
+        else:
+            grade = "bad"
+        
+        badge = self.title_bar.match_badge
+        badge.setText(f"{score:.1f}% Match")
+        if badge.property("grade") != grade:
+            badge.setProperty("grade", grade)
+            badge.style().unpolish(badge)
+            badge.style().polish(badge)
+        
+        # Update title
+        self.title_bar.title_label.setText(f"Preview Mode • {self.current_index + 1} of {len(self.all_results)}")
+        
+        mips = self._cached_mips(image_path)
+        if mips:
+            self._show_pixmap(image_path, mips, self._src_sizes[image_path])
+            return
+        
+        # Dimensions come from the header (µs), so the label doesn't wait
+        # for the background decode
+        src_size = self._src_sizes.get(image_path)
+        if src_size is None:
+            reader = QImageReader(image_path)
+            reader.setAutoTransform(True)
+            src_size = self._src_sizes[image_path] = _read_image_size(reader)
+        
+        if src_size.isValid():
+            self.resolution_label.setText(f"{src_size.width()} × {src_size.height()} px")
+        else:
+            self.resolution_label.setText("")
+        
+        self.image_canvas.set_loading(True)
+        self._start_decode(image_path)
+    
+    def _path_exists(self, image_path: str) -> bool:
+        """os.path.exists, stat'ed once per path until the viewer is reopened."""
+        exists = self._path_exists_cache.get(image_path)
+        if exists is None:
+            exists = self._path_exists_cache[image_path] = os.path.exists(image_path)
+        return exists
+    
+    def _start_decode(self, image_path: str):
+        """Queue a background decode unless one is already running."""
+        if image_path in self._decoding:
+            return
+        
+        self._decoding.add(image_path)
+        job = ImageDecodeJob(image_path, self._decode_size())
+        job.signals.finished.connect(self._on_image_decoded)
+        QThreadPool.globalInstance().start(job)
+    
+    def _decode_size(self) -> QSize:
+        """
+        Largest size worth decoding: the screen in device pixels (the
+        viewer runs maximized, so the image is never shown larger).
+        """
+        screen = self.screen()
+        return screen.size() * screen.devicePixelRatio()
+    
+    def _prefetch_neighbors(self):
+        """Decode the previous and next results into the source cache ahead of navigation."""
+        for index in (self.current_index + 1, self.current_index - 1):
+            if 0 <= index < len(self.all_results):
+                image_path = self.all_results[index]['file_path']
+                if not self._cached_mips(image_path):
+                    self._start_decode(image_path)
+    
+    def _on_image_decoded(self, image_path: str, images: list, src_size: QSize):
+        """Cache a decoded mip chain and show it if it's still the current image (GUI thread)."""
+        self._decoding.discard(image_path)
+        
+        is_current = self.current_result is not None and self.current_result['file_path'] == image_path
+        
+        if not images:
+            if is_current:
                 self._show_error("Failed to load image")
+            return
+        
+        mips = [QPixmap.fromImage(image) for image in images]
+        for level, mip in enumerate(mips):
+            QPixmapCache.insert(self._mip_key(image_path, level), mip)
+        self._src_sizes[image_path] = src_size
+        
+        if is_current:
+            self._show_pixmap(image_path, mips, src_size)
+    
+    def _show_pixmap(self, image_path: str, mips: list, src_size: QSize):
+        """Put a decoded mip chain on the canvas."""
+        # The canvas fits the image to its own size when painting
+        if image_path != self._last_loaded_path:
+            self.image_canvas.set_mips(mips)
+            self._last_loaded_path = image_path
         else:
-            self._show_error("Image file not found")
+            # Back on the image still on the canvas before its decode ended
+            self.image_canvas.set_loading(False)
+        
+        self.resolution_label.setText(f"{src_size.width()} × {src_size.height()} px")
+        
+        self._prefetch_neighbors()
+    
+    @staticmethod
+    def _mip_key(image_path: str, level: int) -> str:
+        """QPixmapCache key for one mip level of a decoded image."""
+        return f"qid-src::{image_path}::{level}"
+    
+    def _cached_mips(self, image_path: str) -> list:
+        """
+        Cached mip levels for a path, largest first (empty on a miss).
+        Levels evicted independently just shorten the chain.
+        """
+        mips = []
+        if image_path not in self._src_sizes:
+            return mips
+        
+        while True:
+            pixmap = QPixmap()
+            if not QPixmapCache.find(self._mip_key(image_path, len(mips)), pixmap):
+                return mips
+            mips.append(pixmap)
     
     def _show_error(self, message: str):
         """Show error message."""
-        self.image_label.clear()
-        self.image_label.setText(f"❌ {message}")
-        font = QFont("Inter, Segoe UI", 16)
-        self.image_label.setFont(font)
-        self.image_label.setStyleSheet(f"color: {COLORS['text_secondary']}; background: transparent;")
+        self.image_canvas.set_message(f"❌ {message}")
+        self._last_loaded_path = None
     
     def _on_prev(self):
         """Show previous image."""
@@ -454,31 +791,7 @@ class ImageViewerQt(QDialog):
         if not file_path.exists():
             return
         
-        # Get the directory
-        directory = file_path.parent
-        
-        # Open in file explorer based on OS
-        system = platform.system()
-        
-        try:
-            if system == "Windows":
-                # Windows: open Explorer and select the file
-                subprocess.run(['explorer', '/select,', str(file_path)])
-            elif system == "Darwin":  # macOS
-                # macOS: open Finder and select the file
-                subprocess.run(['open', '-R', str(file_path)])
-            else:  # Linux
-                # Linux: just open the directory
-                subprocess.run(['xdg-open', str(directory)])
-        except Exception as e:
-            print(f"Failed to open file location: {e}")
-    
-    def resizeEvent(self, event):
-        """Handle window resize - reload image to fit new size."""
-        super().resizeEvent(event)
-        if self.current_result:
-            # Reload image with new dimensions
-            self._load_current_image()
+        _reveal(file_path)
     
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard shortcuts."""
@@ -5,36 +5,263 @@ Full-page indexing interface with live progress and stats.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QProgressBar, QFrame, QFileDialog, QTextEdit
+    QPushButton, QProgressBar, QFrame, QFileDialog, QPlainTextEdit
+)
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QElapsedTimer, QObject, QRunnable, QThreadPool, QSettings
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
 from PySide6.QtGui import QFont
+import os
+import queue
 import time
+import numpy as np
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from pathlib import Path
 
-from .theme import COLORS, SPACING, RADIUS
+from .theme import COLORS, SPACING, RADIUS, get_font
+
+
+# Font specs (point size, weight) for the index screen, resolved through
+# the shared theme fonts
+INDEX_FONT_SPECS = {
+    "header": (28, QFont.Bold),
+    "subtitle": (14, QFont.Normal),
+    "caption": (10, QFont.Bold),
+    "section_header": (12, QFont.Bold),
+    "log_header": (11, QFont.Bold),
+    "body": (13, QFont.Normal),
+    "body_bold": (13, QFont.Bold),
+    "time": (12, QFont.Normal),
+    "browse_button": (12, QFont.Medium),
+    "start_button": (15, QFont.Bold),
+    "stat_value": (28, QFont.Bold),
+    "stat_label": (12, QFont.Normal),
+}
+
+
+def _index_font(role: str) -> QFont:
+    """Shared QFont for an INDEX_FONT_SPECS role."""
+    return get_font(*INDEX_FONT_SPECS[role])
+
+
+def _make_label(text: str, name: str, font_role: str = None, align=None) -> QLabel:
+    """QLabel styled by INDEX_QSS through its objectName."""
+    label = QLabel(text)
+    label.setObjectName(name)
+    if font_role is not None:
+        label.setFont(_index_font(font_role))
+    if align is not None:
+        label.setAlignment(align)
+    return label
+
+
+# Progress bar resolution; finer steps would repaint the gradient chunk
+# without a visible change
+PROGRESS_STEPS = 200
+
+# Activity log lines are appended at most every LOG_FLUSH_MS; only the
+# newest LOG_PENDING_MAX pending lines are kept
+LOG_FLUSH_MS = 100
+LOG_PENDING_MAX = 500
+
+# Lines kept in the activity log; older lines are dropped
+LOG_MAX_LINES = 2000
+
+# How often the worker's latest status message is picked up
+STATUS_POLL_MS = 100
+
 
+# Folder the browse dialog starts in (resolved once, not against the CWD on
+# every open); after the first pick the last chosen folder is remembered
+DEFAULT_BROWSE_DIR = str(Path("data/images").resolve())
+LAST_DIR_KEY = "index/last_dir"
 
-class IndexWorker(QThread):
-    """Background thread for indexing with proper progress tracking."""
+
+# Stylesheet for the whole index screen, parsed once on IndexScreen instead
+# of once per card/label. Card rules also cover the card's labels (QLabel is
+# a QFrame), as the per-card QFrame sheets did.
+INDEX_QSS = f"""
+    QWidget {{
+        background: {COLORS['background']};
+    }}
+    QScrollArea {{
+        background: {COLORS['background']};
+        border: none;
+    }}
+    QScrollBar:vertical {{
+        background: {COLORS['background_elevated']};
+        width: 12px;
+        border-radius: 6px;
+    }}
+    QScrollBar::handle:vertical {{
+        background: {COLORS['border']};
+        border-radius: 6px;
+        min-height: 20px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background: {COLORS['text_tertiary']};
+    }}
+    #stat_card, #stat_card QLabel,
+    #source_frame, #source_frame QLabel {{
+        background: {COLORS['background_elevated']};
+        border: 1px solid {COLORS['border']};
+        border-radius: 12px;
+        padding: 20px;
+    }}
+    QLabel#stat_icon {{
+        font-size: 36px;
+    }}
+    QLabel#stat_value {{
+        color: {COLORS['primary']};
+    }}
+    QLabel#stat_label, QLabel#index_time {{
+        color: {COLORS['text_secondary']};
+    }}
+    QLabel#index_header, QLabel#index_folder, QLabel#index_status {{
+        color: {COLORS['text_primary']};
+    }}
+    QLabel#index_subtitle {{
+        color: {COLORS['text_secondary']};
+        margin-top: 4px;
+    }}
+    QLabel#section_header {{
+        color: {COLORS['text_tertiary']};
+    }}
+    QLabel#source_icon {{
+        font-size: 28px;
+    }}
+    QLabel#index_speed {{
+        color: {COLORS['success']};
+    }}
+    QPushButton#browse_button {{
+        background: {COLORS['primary']};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0 24px;
+    }}
+    QPushButton#browse_button:hover {{
+        background: {COLORS['primary_hover']};
+    }}
+    QProgressBar {{
+        background: {COLORS['background_elevated']};
+        border: none;
+        border-radius: 8px;
+    }}
+    QProgressBar::chunk {{
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 {COLORS['gradient_start']}, 
+            stop:1 {COLORS['gradient_end']}
+        );
+        border-radius: 8px;
+    }}
+    QPlainTextEdit#index_log {{
+        background: {COLORS['background_elevated']};
+        border: 1px solid {COLORS['border']};
+        border-radius: 8px;
+        padding: 12px;
+        color: {COLORS['text_secondary']};
+    }}
+    QPushButton#start_button {{
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 {COLORS['gradient_start']}, 
+            stop:1 {COLORS['gradient_end']}
+        );
+        color: white;
+        border: none;
+        border-radius: 12px;
+    }}
+    QPushButton#start_button:hover {{
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #7c8ef5, 
+            stop:1 #8b5cb8
+        );
+    }}
+    QPushButton#start_button:disabled {{
+        background: {COLORS['background_hover']};
+        color: {COLORS['text_tertiary']};
+    }}
+"""
+
+
+# Final counts of an indexing run, handed to IndexScreen/completed listeners
+IndexStats = namedtuple('IndexStats', 'found new processed skipped errors')
+
+
+class IndexWorkerSignals(QObject):
+    """Signals for IndexWorker (QRunnable can't emit directly)."""
     
     progress = Signal(int, int)  # current, total
-    status = Signal(str)
     log = Signal(str)
-    stats_update = Signal(dict)  # Real-time stats
+    stats_update = Signal(int, int, int, int, int)  # Real-time found, processed, new, skipped, errors
     speed = Signal(float)  # images per second
-    finished = Signal(dict)
+    finished = Signal(object)  # IndexStats
     error = Signal(str)
+
+
+class IndexWorker(QRunnable):
+    """
+    Indexing job with proper progress tracking, run on a pooled thread.
+    
+    Using the global QThreadPool means a retry reuses an idle pooled
+    thread instead of creating and tearing down a QThread per run. The
+    job itself is reused too: reset() prepares it for the next run.
+    """
+    
+    # Progress/stats/log updates are coalesced and emitted at most this
+    # often (seconds) so the GUI thread isn't flooded with queued signals.
+    # The status message isn't a signal at all: IndexScreen polls
+    # last_status (a plain attribute write, atomic under the GIL).
+    EMIT_INTERVAL = 0.1
+    LOG_BUFFER_SIZE = 200
+    
+    # A tuple, for a single str.endswith call per directory entry
+    IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp')
+    
+    # Threads walking top-level subtrees; the walk is I/O latency bound
+    SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
+    # Indexed-library size above which the skip check uses a Bloom filter
+    # instead of holding every indexed path in memory
+    BLOOM_MIN_PATHS = 1_000_000
     
-    def __init__(self, batch_indexer, folder, options):
+    def __init__(self, batch_indexer):
         super().__init__()
+        
+        # IndexScreen keeps a reference (self.worker) and resubmits it,
+        # so Python owns it
+        self.setAutoDelete(False)
+        self.signals = IndexWorkerSignals()
         self.batch_indexer = batch_indexer
+        self.reset(None, {})
+    
+    def reset(self, folder, options):
+        """Prepare for a new run; only call while the job isn't running."""
         self.folder = folder
         self.options = options
         self.start_time = None
         self.last_speed_update = None
         self.last_speed_count = 0
         
+        # Pending updates, flushed by _flush_updates
+        self._last_emit_ts = 0.0
+        self._pending_progress = None
+        self._last_reported_cur = 0
+        self._pending_stats = False
+        self._log_buffer = deque(maxlen=self.LOG_BUFFER_SIZE)
+        
+        # Latest status/progress, read by IndexScreen (status is polled,
+        # progress is used to catch up after it stopped listening)
+        self.last_status = None
+        self.last_progress = None
+        # Set once discovery has finished and the total is known
+        self._scan_complete = False
+        
         # Stats tracking
         self.stats = {
             'found': 0,
@@ -46,134 +273,283 @@ class IndexWorker(QThread):
     
     def run(self):
         """Run indexing in background with live updates."""
+        options = self.options
+        recursive = options.get('recursive', True)
+        skip_existing = options.get('skip_existing', True)
+        
         try:
             self.start_time = time.time()
             self.last_speed_update = self.start_time
             
-            self.status.emit("Scanning for images...")
-            self.log.emit("🔍 Scanning for images...")
-            
-            # Find all images
-            image_paths = self._find_images()
+            self.last_status = "Scanning for images..."
+            self.signals.log.emit("🔍 Scanning for images...")
             
-            if not image_paths:
-                self.log.emit("⚠️ No images found in directory")
-                self.finished.emit(self.stats)
-                return
+            # Already-indexed paths are loaded up front (one query), so each
+            # batch can be filtered as soon as the scan discovers it. For
+            # very large libraries a Bloom filter stands in for the full
+            # path set, with its hits confirmed against the database
+            existing = None
+            confirm = None
+            metadata_store = self.batch_indexer.metadata_store
+            if skip_existing:
+                if len(metadata_store) >= self.BLOOM_MIN_PATHS:
+                    existing = metadata_store.get_path_bloom()
+                    confirm = metadata_store.get_existing_paths
+                else:
+                    existing = metadata_store.get_all_paths()
             
-            self.stats['found'] = len(image_paths)
-            self.log.emit(f"📊 Found {len(image_paths)} images")
-            self.stats_update.emit(self.stats.copy())
+            # Scanning and encoding overlap: batches are processed as they
+            # are discovered instead of after the whole tree is walked
+            self._process_images(self._new_image_batches(recursive, existing, confirm))
             
-            # Check which are already indexed
-            self.status.emit("Checking for existing images...")
-            self.log.emit("🔍 Checking for already indexed images...")
-            
-            if self.options.get('skip_existing', True):
-                images_to_process = []
-                for path in image_paths:
-                    if not self.batch_indexer.metadata_store.exists(str(path.absolute())):
-                        images_to_process.append(path)
-                    else:
-                        self.stats['skipped'] += 1
-                
-                self.stats['new'] = len(images_to_process)
-                self.log.emit(f"⏭️ Skipping {self.stats['skipped']} already indexed images")
-                self.log.emit(f"🆕 Processing {len(images_to_process)} new images")
-            else:
-                images_to_process = image_paths
-                self.stats['new'] = len(images_to_process)
+            if not self.stats['found']:
+                self.signals.log.emit("⚠️ No images found in directory")
+                self.signals.finished.emit(IndexStats(**self.stats))
+                return
             
-            self.stats_update.emit(self.stats.copy())
+            self.signals.log.emit(f"📊 Found {self.stats['found']} images")
+            if skip_existing:
+                self.signals.log.emit(f"⏭️ Skipped {self.stats['skipped']} already indexed images")
             
-            if not images_to_process:
-                self.log.emit("✅ All images already indexed!")
-                self.finished.emit(self.stats)
+            if not self.stats['new']:
+                self.signals.log.emit("✅ All images already indexed!")
+                self.signals.finished.emit(IndexStats(**self.stats))
                 return
             
-            # Process images in batches
-            self.status.emit("Processing images...")
-            self._process_images(images_to_process)
-            
             # Final update
-            self.log.emit(f"✅ Indexing complete! Processed {self.stats['processed']} images")
-            self.finished.emit(self.stats)
+            self.signals.log.emit(f"✅ Indexing complete! Processed {self.stats['processed']} images")
+            self.signals.finished.emit(IndexStats(**self.stats))
             
         except Exception as e:
             import traceback
-            self.log.emit(f"❌ Error: {str(e)}")
-            self.log.emit(traceback.format_exc())
-            self.error.emit(str(e))
+            self.signals.log.emit(f"❌ Error: {str(e)}")
+            self.signals.log.emit(traceback.format_exc())
+            self.signals.error.emit(str(e))
     
-    def _find_images(self):
-        """Find all image files in directory."""
-        folder = Path(self.folder)
-        extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp'}
+    def _new_image_batches(self, recursive: bool, existing, confirm=None):
+        """
+        Yield batches of images still to be indexed, as they're found.
+        
+        Paths in existing (None when not skipping) are counted as skipped;
+        found/new/skipped stats grow as the scan progresses. When existing
+        can give false positives, confirm(paths) returns which of its hits
+        are really indexed.
+        """
+        batch_size = self.batch_indexer.batch_size
+        pending = []
         
-        image_paths = []
+        for found in self._find_images(recursive):
+            if existing is None:
+                new = found
+            elif confirm is None:
+                new = [path for path in found if path not in existing]
+            else:
+                new = []
+                hits = []
+                for path in found:
+                    (hits if path in existing else new).append(path)
+                if hits:
+                    indexed = confirm(hits)
+                    new.extend(path for path in hits if path not in indexed)
+            
+            self.stats['skipped'] += len(found) - len(new)
+            
+            self.stats['found'] += len(found)
+            self.stats['new'] += len(new)
+            self._pending_stats = True
+            
+            pending.extend(new)
+            while len(pending) >= batch_size:
+                yield pending[:batch_size]
+                del pending[:batch_size]
+        
+        self._scan_complete = True
+        if pending:
+            yield pending
+    
+    def _find_images(self, recursive: bool):
+        """
+        Find all image files in directory, yielding them per directory.
+        
+        Walks the tree with os.scandir, whose entries already know their
+        file type, so there's no stat per entry. Top-level subtrees are
+        walked in parallel, which hides per-directory latency on network
+        drives. Paths are absolute strings, built once here and reused
+        for the existence check, encoding and metadata.
+        """
+        images, subdirs = self._scan_dir(os.path.abspath(self.folder))
+        if images:
+            yield images
+        
+        if not (recursive and subdirs):
+            return
         
-        if self.options.get('recursive', True):
-            for ext in extensions:
-                image_paths.extend(folder.rglob(f"*{ext}"))
-                image_paths.extend(folder.rglob(f"*{ext.upper()}"))
-        else:
-            for ext in extensions:
-                image_paths.extend(folder.glob(f"*{ext}"))
-                image_paths.extend(folder.glob(f"*{ext.upper()}"))
+        # Walkers hand each directory's images over through the queue and
+        # put None once their subtree is done
+        found = queue.Queue()
+        workers = min(self.SCAN_WORKERS, len(subdirs))
         
-        return sorted(set(image_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            walks = [pool.submit(self._walk_tree, top, found.put) for top in subdirs]
+            
+            remaining = len(walks)
+            while remaining:
+                images = found.get()
+                if images is None:
+                    remaining -= 1
+                else:
+                    yield images
+            
+            # Re-raise anything a walker hit
+            for walk in walks:
+                walk.result()
     
-    def _process_images(self, image_paths):
-        """Process images in batches with live progress updates."""
-        total = len(image_paths)
-        batch_size = self.batch_indexer.batch_size
+    def _scan_dir(self, directory: str):
+        """Image files and subdirectories directly inside directory."""
+        images = []
+        subdirs = []
         
-        for i in range(0, total, batch_size):
-            batch = image_paths[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (total + batch_size - 1) // batch_size
-            
-            self.status.emit(f"Processing batch {batch_num}/{total_batches}...")
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(self.IMAGE_EXTENSIONS) and entry.is_file():
+                        images.append(entry.path)
+        except OSError:
+            # Unreadable directory; skip it, as rglob did
+            pass
+        
+        return images, subdirs
+    
+    def _walk_tree(self, top: str, emit):
+        """Pass each directory's images under top to emit (runs on a scan thread)."""
+        try:
+            pending = [top]
+            while pending:
+                images, subdirs = self._scan_dir(pending.pop())
+                if images:
+                    emit(images)
+                pending.extend(subdirs)
+        finally:
+            emit(None)
+    
+    def _process_images(self, batches):
+        """
+        Process batches of images with live progress updates.
+        
+        Encoding runs one batch ahead on a helper thread (torch releases
+        the GIL), so batch N+1 is being encoded while batch N is added to
+        the vector and metadata stores. Progress is reported against the
+        number of new images once the scan is complete; until then the
+        total is reported as 0 (unknown).
+        """
+        # Bound once; the loop below runs once per batch
+        image_encoder = self.batch_indexer.image_encoder
+        vector_store = self.batch_indexer.vector_store
+        metadata_store = self.batch_indexer.metadata_store
+        batch_size = self.batch_indexer.batch_size
+        stats = self.stats
+        
+        # Two embedding buffers, alternated between batches: the encoder
+        # fills one while the other is being stored (the vector store
+        # copies the vectors into its index on add)
+        embedding_buffers = [
+            np.empty((batch_size, vector_store.dimension), dtype=np.float32)
+            for _ in range(2)
+        ]
+        
+        def encode(batch, buffer):
+            return image_encoder.encode_batch(
+                batch,
+                batch_size=len(batch),
+                show_progress=False,
+                out=buffer[:len(batch)]
+            )
+        
+        batches = iter(batches)
+        done = 0
+        batch_num = 0
+        
+        with ThreadPoolExecutor(max_workers=1) as encoder:
+            next_batch = next(batches, None)
+            if next_batch is not None:
+                self.last_status = "Processing images..."
+                pending = encoder.submit(encode, next_batch, embedding_buffers[0])
             
-            try:
-                # Encode images
-                embeddings = self.batch_indexer.image_encoder.encode_batch(
-                    [str(p) for p in batch],
-                    batch_size=len(batch),
-                    show_progress=False
-                )
+            while next_batch is not None:
+                batch, encoding = next_batch, pending
+                batch_num += 1
                 
-                # Add to vector store
-                vector_ids = self.batch_indexer.vector_store.add(embeddings)
+                # Start on the next batch before storing this one
+                next_batch = next(batches, None)
+                if next_batch is not None:
+                    pending = encoder.submit(encode, next_batch, embedding_buffers[batch_num % 2])
                 
-                # Add metadata
-                batch_processed = 0
-                for vector_id, path in zip(vector_ids, batch):
-                    success = self.batch_indexer.metadata_store.add(
-                        vector_id=vector_id,
-                        file_path=str(path.absolute())
+                try:
+                    # Encode images
+                    embeddings = encoding.result()
+                    
+                    # Add to vector store
+                    vector_ids = vector_store.add(embeddings)
+                    
+                    # Add metadata (one transaction for the whole batch)
+                    batch_processed = metadata_store.add_many(
+                        list(zip(vector_ids, batch))
                     )
-                    if success:
-                        batch_processed += 1
-                        self.stats['processed'] += 1
-                
-                # Update progress
-                current_total = min(i + len(batch), total)
-                self.progress.emit(current_total, total)
+                    stats['processed'] += batch_processed
+                    
+                    # Update progress
+                    done += len(batch)
+                    self._pending_progress = (done, stats['new'] if self._scan_complete else 0)
+                    
+                    # Update speed
+                    self._update_speed()
+                    
+                    # Update stats
+                    self._pending_stats = True
+                    
+                    # Log batch completion
+                    self._log_buffer.append(f"✅ Batch {batch_num}: {batch_processed}/{len(batch)} images indexed")
                 
-                # Update speed
-                self._update_speed()
+                except Exception as e:
+                    stats['errors'] += len(batch)
+                    self._log_buffer.append(f"❌ Error in batch {batch_num}: {str(e)}")
                 
-                # Update stats
-                self.stats_update.emit(self.stats.copy())
-                
-                # Log batch completion
-                self.log.emit(f"✅ Batch {batch_num}/{total_batches}: {batch_processed}/{len(batch)} images indexed")
-                
-            except Exception as e:
-                self.stats['errors'] += len(batch)
-                self.log.emit(f"❌ Error in batch {batch_num}: {str(e)}")
-                continue
+                self._flush_updates()
+        
+        self._flush_updates(force=True)
+    
+    def _flush_updates(self, force: bool = False):
+        """Emit pending progress/stats/log updates, throttled to EMIT_INTERVAL."""
+        now = time.monotonic()
+        if not force and now - self._last_emit_ts < self.EMIT_INTERVAL:
+            return
+        self._last_emit_ts = now
+        
+        if self._pending_progress is not None:
+            self.last_progress = self._pending_progress
+            # Drop steps finer than the bar can show (1/200 of the total)
+            current, total = self._pending_progress
+            step = max(1, total // 200)
+            if force or current >= total or current - self._last_reported_cur >= step:
+                self.signals.progress.emit(current, total)
+                self._last_reported_cur = current
+                self._pending_progress = None
+        if self._pending_stats:
+            self._emit_stats()
+            self._pending_stats = False
+        if self._log_buffer:
+            self.signals.log.emit("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+    
+    def _emit_stats(self):
+        """Emit the running stats as plain ints (no dict copy per update)."""
+        stats = self.stats
+        self.signals.stats_update.emit(
+            stats['found'], stats['processed'], stats['new'],
+            stats['skipped'], stats['errors']
+        )
     
     def _update_speed(self):
         """Calculate and emit processing speed."""
@@ -185,7 +561,7 @@ class IndexWorker(QThread):
             
             if elapsed > 0:
                 speed = count_diff / elapsed
-                self.speed.emit(speed)
+                self.signals.speed.emit(speed)
             
             self.last_speed_update = current_time
             self.last_speed_count = self.stats['processed']
@@ -197,60 +573,84 @@ class StatCard(QFrame):
     def __init__(self, icon: str, label: str, value: str = "0", parent=None):
         super().__init__(parent)
         
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['background_elevated']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-                padding: 20px;
-            }}
-        """)
+        # Card styling comes from INDEX_QSS on IndexScreen
+        self.setObjectName("stat_card")
         
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         layout.setAlignment(Qt.AlignCenter)
         
-        icon_label = QLabel(icon)
-        icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("font-size: 36px;")
+        icon_label = _make_label(icon, "stat_icon", align=Qt.AlignCenter)
         
-        self.value_label = QLabel(value)
-        self.value_label.setAlignment(Qt.AlignCenter)
-        font = QFont("Inter, Segoe UI", 28, QFont.Bold)
-        self.value_label.setFont(font)
-        self.value_label.setStyleSheet(f"color: {COLORS['primary']};")
+        self._current = value
+        self.value_label = _make_label(value, "stat_value", "stat_value", Qt.AlignCenter)
         
-        label_text = QLabel(label)
-        label_text.setAlignment(Qt.AlignCenter)
-        font = QFont("Inter, Segoe UI", 12)
-        label_text.setFont(font)
-        label_text.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        label_text = _make_label(label, "stat_label", "stat_label", Qt.AlignCenter)
         
         layout.addWidget(icon_label)
         layout.addWidget(self.value_label)
         layout.addWidget(label_text)
     
     def set_value(self, value: str):
-        """Update value."""
+        """Update value (no-op if unchanged, to avoid a relayout)."""
+        if value == self._current:
+            return
+        self._current = value
         self.value_label.setText(value)
 
 
 class IndexScreen(QWidget):
     """Full-page indexing interface."""
     
-    completed = Signal(dict)
+    completed = Signal(object)  # IndexStats
     
     def __init__(self, batch_indexer, parent=None):
         super().__init__(parent)
         
         self.batch_indexer = batch_indexer
-        self.worker = None
-        self.start_time = None
         self.folder = None
-        
-        self.setStyleSheet(f"background: {COLORS['background']};")
-        
+        self._settings = QSettings()
+        self._indexing = False
+        self._last_status = None
+        self._last_polled_status = None
+        self._last_progress_value = -1
+        self._progress_busy = False
+        self._live_updates = False
+        
+        # Worker status is polled rather than signalled
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(STATUS_POLL_MS)
+        self._status_timer.timeout.connect(self._poll_status)
+        
+        # Activity log: messages are buffered and flushed together
+        self._log_buffer = deque(maxlen=LOG_PENDING_MAX)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        
+        # Elapsed-time display: a coarse 1 Hz timer, stopped while hidden
+        self._elapsed = QElapsedTimer()
+        self._last_elapsed_sec = None
+        self._last_time_str = None
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setTimerType(Qt.CoarseTimer)
+        self._ui_timer.setInterval(1000)
+        self._ui_timer.timeout.connect(self._update_time)
+        
+        # One worker for the screen's lifetime, reset and resubmitted per
+        # run; explicitly queued: it never waits on GUI-thread slots
+        self.worker = IndexWorker(self.batch_indexer)
+        self.worker.signals.log.connect(self._add_log, Qt.QueuedConnection)
+        self.worker.signals.finished.connect(self._on_finished, Qt.QueuedConnection)
+        self.worker.signals.error.connect(self._on_error, Qt.QueuedConnection)
+        
+        self.setStyleSheet(INDEX_QSS)
+        
+        # Build the whole widget tree without intermediate repaints
+        self.setUpdatesEnabled(False)
         self._create_ui()
+        self.setUpdatesEnabled(True)
     
     def _create_ui(self):
         """Create UI."""
@@ -259,25 +659,6 @@ class IndexScreen(QWidget):
         
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background: {COLORS['background']};
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background: {COLORS['background_elevated']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {COLORS['border']};
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {COLORS['text_tertiary']};
-            }}
-        """)
         
         # Container for scrollable content
         container = QWidget()
@@ -293,17 +674,11 @@ class IndexScreen(QWidget):
         main_layout.addWidget(scroll)
         
         # Header (compact)
-        header = QLabel("Image Indexing")
-        font = QFont("Inter, Segoe UI", 28, QFont.Bold)
-        header.setFont(font)
-        header.setStyleSheet(f"color: {COLORS['text_primary']};")
+        header = _make_label("Image Indexing", "index_header", "header")
         layout.addWidget(header)
         
         # Subtitle (minimal spacing)
-        subtitle = QLabel("Extract AI features and index metadata from your local library")
-        font = QFont("Inter, Segoe UI", 14)
-        subtitle.setFont(font)
-        subtitle.setStyleSheet(f"color: {COLORS['text_secondary']}; margin-top: 4px;")
+        subtitle = _make_label("Extract AI features and index metadata from your local library", "index_subtitle", "subtitle")
         layout.addWidget(subtitle)
         
         # Small gap before folder card
@@ -311,54 +686,28 @@ class IndexScreen(QWidget):
         
         # Folder selection
         folder_frame = QFrame()
-        folder_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['background_elevated']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-                padding: 20px;
-            }}
-        """)
+        folder_frame.setObjectName("source_frame")
         
         folder_layout = QHBoxLayout(folder_frame)
         
-        folder_icon = QLabel("📁")
-        folder_icon.setStyleSheet("font-size: 28px;")
+        folder_icon = _make_label("📁", "source_icon")
         
         folder_info = QVBoxLayout()
         folder_info.setSpacing(4)
         
-        folder_title = QLabel("SOURCE FOLDER")
-        font = QFont("Inter, Segoe UI", 10, QFont.Bold)
-        folder_title.setFont(font)
-        folder_title.setStyleSheet(f"color: {COLORS['text_tertiary']};")
+        folder_title = _make_label("SOURCE FOLDER", "section_header", "caption")
         
-        self.folder_label = QLabel("No folder selected")
-        font = QFont("Inter, Segoe UI", 13)
-        self.folder_label.setFont(font)
-        self.folder_label.setStyleSheet(f"color: {COLORS['text_primary']};")
+        self.folder_label = _make_label("No folder selected", "index_folder", "body")
         
         folder_info.addWidget(folder_title)
         folder_info.addWidget(self.folder_label)
         
         self.browse_btn = QPushButton("Browse Folder")
         self.browse_btn.clicked.connect(self._browse_folder)
-        font = QFont("Inter, Segoe UI", 12, QFont.Medium)
-        self.browse_btn.setFont(font)
+        self.browse_btn.setFont(_index_font("browse_button"))
         self.browse_btn.setCursor(Qt.PointingHandCursor)
         self.browse_btn.setFixedHeight(44)
-        self.browse_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {COLORS['primary']};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 24px;
-            }}
-            QPushButton:hover {{
-                background: {COLORS['primary_hover']};
-            }}
-        """)
+        self.browse_btn.setObjectName("browse_button")
         
         folder_layout.addWidget(folder_icon)
         folder_layout.addLayout(folder_info, stretch=1)
@@ -375,44 +724,21 @@ class IndexScreen(QWidget):
         progress_layout.setContentsMargins(0, 0, 0, 0)
         
         # Progress header
-        progress_header = QLabel("📊 INDEXING PROGRESS")
-        font = QFont("Inter, Segoe UI", 12, QFont.Bold)
-        progress_header.setFont(font)
-        progress_header.setStyleSheet(f"color: {COLORS['text_tertiary']};")
+        progress_header = _make_label("📊 INDEXING PROGRESS", "section_header", "section_header")
         
         # Progress bar
         self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, PROGRESS_STEPS)
         self.progress_bar.setMinimumHeight(16)
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background: {COLORS['background_elevated']};
-                border: none;
-                border-radius: 8px;
-            }}
-            QProgressBar::chunk {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {COLORS['gradient_start']}, 
-                    stop:1 {COLORS['gradient_end']}
-                );
-                border-radius: 8px;
-            }}
-        """)
         
         # Status and speed
         status_row = QHBoxLayout()
         status_row.setSpacing(20)
         
-        self.status_label = QLabel("Ready to index")
-        font = QFont("Inter, Segoe UI", 13)
-        self.status_label.setFont(font)
-        self.status_label.setStyleSheet(f"color: {COLORS['text_primary']};")
+        self.status_label = _make_label("Ready to index", "index_status", "body")
         
-        self.speed_label = QLabel("")
-        font = QFont("Inter, Segoe UI", 13, QFont.Bold)
-        self.speed_label.setFont(font)
-        self.speed_label.setStyleSheet(f"color: {COLORS['success']};")
+        self.speed_label = _make_label("", "index_speed", "body_bold")
         
         status_row.addWidget(self.status_label)
         status_row.addStretch()
@@ -433,10 +759,7 @@ class IndexScreen(QWidget):
         stats_layout.setSpacing(16)
         stats_layout.setContentsMargins(0, 0, 0, 0)
         
-        stats_header = QLabel("📈 LIVE STATISTICS")
-        font = QFont("Inter, Segoe UI", 12, QFont.Bold)
-        stats_header.setFont(font)
-        stats_header.setStyleSheet(f"color: {COLORS['text_tertiary']};")
+        stats_header = _make_label("📈 LIVE STATISTICS", "section_header", "section_header")
         
         cards_layout = QHBoxLayout()
         cards_layout.setSpacing(20)
@@ -463,31 +786,18 @@ class IndexScreen(QWidget):
         info_layout.setSpacing(16)
         info_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.time_label = QLabel("⏱️  Time Elapsed: 00:00:00")
-        font = QFont("Inter, Segoe UI", 12)
-        self.time_label.setFont(font)
-        self.time_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        self.time_label = _make_label("⏱️  Time Elapsed: 00:00:00", "index_time", "time")
         
         # Log area
-        log_header = QLabel("📋 Activity Log")
-        font = QFont("Inter, Segoe UI", 11, QFont.Bold)
-        log_header.setFont(font)
-        log_header.setStyleSheet(f"color: {COLORS['text_tertiary']};")
+        log_header = _make_label("📋 Activity Log", "section_header", "log_header")
         
-        self.log_area = QTextEdit()
+        self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
+        self.log_area.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_area.setMinimumHeight(200)
         font = QFont("Consolas, Monaco, monospace", 10)
         self.log_area.setFont(font)
-        self.log_area.setStyleSheet(f"""
-            QTextEdit {{
-                background: {COLORS['background_elevated']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 12px;
-                color: {COLORS['text_secondary']};
-            }}
-        """)
+        self.log_area.setObjectName("index_log")
         
         info_layout.addWidget(self.time_label)
         info_layout.addWidget(log_header)
@@ -501,33 +811,10 @@ class IndexScreen(QWidget):
         # Start button
         self.start_btn = QPushButton("🚀 Start Indexing")
         self.start_btn.clicked.connect(self._start_indexing)
-        font = QFont("Inter, Segoe UI", 15, QFont.Bold)
-        self.start_btn.setFont(font)
+        self.start_btn.setFont(_index_font("start_button"))
         self.start_btn.setMinimumHeight(56)
         self.start_btn.setCursor(Qt.PointingHandCursor)
-        self.start_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {COLORS['gradient_start']}, 
-                    stop:1 {COLORS['gradient_end']}
-                );
-                color: white;
-                border: none;
-                border-radius: 12px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #7c8ef5, 
-                    stop:1 #8b5cb8
-                );
-            }}
-            QPushButton:disabled {{
-                background: {COLORS['background_hover']};
-                color: {COLORS['text_tertiary']};
-            }}
-        """)
+        self.start_btn.setObjectName("start_button")
         self.start_btn.setEnabled(False)
         
         layout.addWidget(self.start_btn)
@@ -537,19 +824,23 @@ class IndexScreen(QWidget):
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Image Folder",
-            "data/images"
+            self._settings.value(LAST_DIR_KEY, DEFAULT_BROWSE_DIR)
         )
         
-        if folder:
-            self.folder = folder
-            self.folder_label.setText(folder)
-            self.start_btn.setEnabled(True)
-            self.log_area.clear()
-            self._add_log(f"📁 Selected folder: {folder}")
+        if not folder:
+            return
+        
+        self._settings.setValue(LAST_DIR_KEY, folder)
+        self.folder = folder
+        self.folder_label.setText(folder)
+        self.start_btn.setEnabled(True)
+        self._clear_log()
+        self._add_log(f"📁 Selected folder: {folder}")
     
     def _start_indexing(self):
         """Start indexing process."""
-        if not self.folder:
+        # The worker is reused between runs; never reset it mid-run
+        if self._indexing or not self.folder:
             return
         
         # Show progress UI
@@ -561,7 +852,7 @@ class IndexScreen(QWidget):
         self.found_card.set_value("0")
         self.processed_card.set_value("0")
         self.skipped_card.set_value("0")
-        self.progress_bar.setValue(0)
+        self._set_progress(0)
         self.speed_label.setText("")
         
         # Disable controls
@@ -570,93 +861,195 @@ class IndexScreen(QWidget):
         self.browse_btn.setEnabled(False)
         
         # Start timer
-        self.start_time = time.time()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._update_time)
-        self.timer.start(100)  # Update every 100ms for smooth display
+        self._indexing = True
+        self._last_elapsed_sec = None
+        self._elapsed.start()
+        self._update_time()
+        self._ui_timer.start()
         
         # Create worker
-        options = {
+        # Read-only: the worker reads these from its pool thread
+        options = MappingProxyType({
             'recursive': True,
             'validate': True,
             'skip_existing': True
-        }
+        })
         
-        self.worker = IndexWorker(self.batch_indexer, self.folder, options)
-        self.worker.status.connect(self._update_status)
-        self.worker.log.connect(self._add_log)
-        self.worker.progress.connect(self._update_progress)
-        self.worker.speed.connect(self._update_speed)
-        self.worker.stats_update.connect(self._update_stats)
-        self.worker.finished.connect(self._on_finished)
-        self.worker.error.connect(self._on_error)
+        self.worker.reset(self.folder, options)
+        self._last_polled_status = None
+        self._set_live_updates(True)
         
         self._add_log("🚀 Starting indexing process...")
-        self.worker.start()
+        QThreadPool.globalInstance().start(self.worker)
     
     def _update_progress(self, current: int, total: int):
         """Update progress bar."""
         if total > 0:
+            self._set_progress(min(PROGRESS_STEPS, current * PROGRESS_STEPS // total))
             percentage = int((current / total) * 100)
-            self.progress_bar.setValue(percentage)
-            self.status_label.setText(f"Processing: {current:,}/{total:,} images ({percentage}%)")
+            self._update_status(f"Processing: {current:,}/{total:,} images ({percentage}%)")
+        else:
+            # Still scanning, so there's no total to measure against yet
+            self._set_progress_busy(True)
+            self._update_status(f"Processing: {current:,} images (still scanning...)")
+    
+    def _set_progress_busy(self, busy: bool):
+        """Switch the bar between indeterminate (busy) and step mode."""
+        if busy != self._progress_busy:
+            self._progress_busy = busy
+            self.progress_bar.setRange(0, 0 if busy else PROGRESS_STEPS)
+            # setRange clamps the value; make the next _set_progress apply
+            self._last_progress_value = -1
+    
+    def _set_progress(self, value: int):
+        """Set the bar value, skipping the repaint if it didn't move."""
+        self._set_progress_busy(False)
+        if value != self._last_progress_value:
+            self._last_progress_value = value
+            self.progress_bar.setValue(value)
     
     def _update_speed(self, speed: float):
         """Update speed indicator."""
         if speed > 0:
             self.speed_label.setText(f"⚡ {speed:.1f} img/s")
     
-    def _update_stats(self, stats: dict):
+    def _update_stats(self, found: int, processed: int, new: int, skipped: int, errors: int):
         """Update statistics cards."""
-        self.found_card.set_value(f"{stats.get('found', 0):,}")
-        self.processed_card.set_value(f"{stats.get('processed', 0):,}")
-        self.skipped_card.set_value(f"{stats.get('skipped', 0):,}")
+        self.found_card.set_value(f"{found:,}")
+        self.processed_card.set_value(f"{processed:,}")
+        self.skipped_card.set_value(f"{skipped:,}")
     
     def _update_status(self, message: str):
-        """Update status message."""
+        """Update status message (no-op if unchanged)."""
+        if message == self._last_status:
+            return
+        self._last_status = message
         self.status_label.setText(message)
     
     def _add_log(self, message: str):
-        """Add log message."""
-        self.log_area.append(message)
+        """Queue a log message; queued messages are appended in one go."""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Append all queued log messages with a single layout pass."""
+        if not self._log_buffer:
+            return
+        
+        self.log_area.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
         # Auto-scroll to bottom
         scrollbar = self.log_area.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    def _clear_log(self):
+        """Clear the log, including messages not yet flushed."""
+        self._log_buffer.clear()
+        self.log_area.clear()
+    
     def _update_time(self):
         """Update elapsed time."""
-        if self.start_time:
-            elapsed = int(time.time() - self.start_time)
-            hours = elapsed // 3600
-            minutes = (elapsed % 3600) // 60
-            seconds = elapsed % 60
-            
-            self.time_label.setText(f"⏱️  Time Elapsed: {hours:02d}:{minutes:02d}:{seconds:02d}")
+        if not self._elapsed.isValid():
+            return
+        
+        # Only reformat when the displayed second rolls over
+        elapsed = self._elapsed.elapsed() // 1000
+        if elapsed == self._last_elapsed_sec:
+            return
+        self._last_elapsed_sec = elapsed
+        
+        minutes, seconds = divmod(elapsed, 60)
+        hours, minutes = divmod(minutes, 60)
+        
+        time_str = f"⏱️  Time Elapsed: {hours:02d}:{minutes:02d}:{seconds:02d}"
+        if time_str != self._last_time_str:
+            self._last_time_str = time_str
+            self.time_label.setText(time_str)
     
-    def _on_finished(self, stats: dict):
+    def _live_slots(self):
+        """(signal, slot) pairs for the display-only worker updates."""
+        signals = self.worker.signals
+        return [
+            (signals.progress, self._update_progress),
+            (signals.speed, self._update_speed),
+            (signals.stats_update, self._update_stats),
+        ]
+    
+    def _set_live_updates(self, enabled: bool):
+        """Connect or disconnect the display-only worker updates."""
+        if enabled == self._live_updates:
+            return
+        self._live_updates = enabled
+        
+        for signal, slot in self._live_slots():
+            if enabled:
+                signal.connect(slot, Qt.QueuedConnection)
+            else:
+                signal.disconnect(slot)
+        
+        if enabled:
+            self._status_timer.start()
+        else:
+            self._status_timer.stop()
+    
+    def _poll_status(self):
+        """Show the worker's latest status message if it changed."""
+        message = self.worker.last_status
+        if message is not None and message != self._last_polled_status:
+            self._last_polled_status = message
+            self._update_status(message)
+    
+    def _catch_up(self):
+        """Refresh the display from the worker's latest state."""
+        self._poll_status()
+        if self.worker.last_progress is not None:
+            self._update_progress(*self.worker.last_progress)
+        self._update_stats(**self.worker.stats)
+    
+    def showEvent(self, event):
+        """Resume live updates and the elapsed-time display while indexing."""
+        super().showEvent(event)
+        if self._indexing:
+            self._set_live_updates(True)
+            self._catch_up()
+            self._update_time()
+            self._ui_timer.start()
+    
+    def hideEvent(self, event):
+        """Stop handling display-only updates while hidden."""
+        super().hideEvent(event)
+        self._ui_timer.stop()
+        if self._indexing:
+            self._set_live_updates(False)
+    
+    def _on_finished(self, stats: IndexStats):
         """Handle completion."""
-        if hasattr(self, 'timer'):
-            self.timer.stop()
+        self._indexing = False
+        self._ui_timer.stop()
+        self._set_live_updates(False)
+        self._update_time()
         
         # Update UI
-        self.progress_bar.setValue(100)
-        self.status_label.setText("✅ Indexing complete!")
+        self._set_progress(PROGRESS_STEPS)
+        self._update_status("✅ Indexing complete!")
         self.speed_label.setText("")
         
-        # Update final stats
-        self.found_card.set_value(f"{stats['found']:,}")
-        self.processed_card.set_value(f"{stats['processed']:,}")
-        self.skipped_card.set_value(f"{stats['skipped']:,}")
+        # Update final stats (each count formatted once, reused in the log)
+        found, processed, skipped = (f"{n:,}" for n in (stats.found, stats.processed, stats.skipped))
+        self.found_card.set_value(found)
+        self.processed_card.set_value(processed)
+        self.skipped_card.set_value(skipped)
         
         # Re-enable controls
         self.start_btn.setText("✅ Indexing Complete")
         self.browse_btn.setEnabled(True)
         
-        self._add_log(f"✅ Successfully indexed {stats['processed']:,} images!")
-        self._add_log(f"⏭️ Skipped {stats['skipped']:,} already indexed images")
+        self._add_log(f"✅ Successfully indexed {processed} images!")
+        self._add_log(f"⏭️ Skipped {skipped} already indexed images")
         
-        if stats.get('errors', 0) > 0:
-            self._add_log(f"⚠️ {stats['errors']} errors occurred")
+        if stats.errors > 0:
+            self._add_log(f"⚠️ {stats.errors} errors occurred")
         
         # Get total count from metadata store
         try:
@@ -670,10 +1063,12 @@ class IndexScreen(QWidget):
     
     def _on_error(self, error: str):
         """Handle error."""
-        if hasattr(self, 'timer'):
-            self.timer.stop()
+        self._indexing = False
+        self._ui_timer.stop()
+        self._set_live_updates(False)
+        self._update_time()
         
-        self.status_label.setText(f"❌ Error occurred")
+        self._update_status(f"❌ Error occurred")
         self.start_btn.setEnabled(True)
         self.start_btn.setText("🔄 Retry")
         self.browse_btn.setEnabled(True)
@@ -690,7 +1085,7 @@ class IndexScreen(QWidget):
         self.start_btn.setEnabled(bool(self.folder))
         self.browse_btn.setEnabled(True)
         
-        self.log_area.clear()
-        self.progress_bar.setValue(0)
-        self.status_label.setText("Ready to index")
+        self._clear_log()
+        self._set_progress(0)
+        self._update_status("Ready to index")
         self.speed_label.setText("")
\ No newline at end of file
@@ -13,15 +13,70 @@ from PySide6.QtGui import QFont, QShortcut, QKeySequence, QMouseEvent
 from .theme import COLORS, SPACING
 from .home_screen import HomeScreen
 from .search_screen import SearchScreen
-from .index_screen import IndexScreen
+from .index_screen import IndexScreen, IndexStats
 from .settings_screen import SettingsScreen
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QIcon, QPixmap, QImageReader
 from PySide6.QtWidgets import QStyle
 
 from PySide6.QtWidgets import QGraphicsOpacityEffect, QSizePolicy
 from PySide6.QtCore import QPropertyAnimation
 
 
+# Stylesheet for the whole title bar, parsed once on CustomTitleBar instead
+# of once per button
+TITLEBAR_QSS = f"""
+    CustomTitleBar {{
+        background: {COLORS['background_elevated']};
+        border-bottom: 1px solid {COLORS['border']};
+        border-top-left-radius: 12px;
+        border-top-right-radius: 12px;
+    }}
+    CustomTitleBar[maximized="true"] {{
+        border-top-left-radius: 0px;
+        border-top-right-radius: 0px;
+    }}
+    QLabel#title_logo {{
+        background: transparent;
+        border: none;
+    }}
+    QLabel#title_stats {{
+        color: {COLORS['text_primary']};
+        background: transparent;
+        padding: 0;
+        border: none;
+    }}
+    QPushButton#nav_btn {{
+        background: transparent;
+        border: none;
+        border-radius: 8px;
+        padding: 0 16px;
+        color: {COLORS['text_secondary']};
+    }}
+    QPushButton#nav_btn:hover {{
+        background: {COLORS['background_hover']};
+        color: {COLORS['text_primary']};
+    }}
+    QPushButton#nav_btn[active="true"] {{
+        background: {COLORS['primary']};
+        color: white;
+    }}
+    QPushButton#control_button, QPushButton#close_btn {{
+        background: transparent;
+        border: none;
+        border-radius: 6px;
+        color: {COLORS['text_primary']};
+    }}
+    QPushButton#control_button:hover {{
+        background: {COLORS['background_hover']};
+        color: white;
+    }}
+    QPushButton#close_btn:hover {{
+        background: #ff4d4f;
+        color: white;
+    }}
+"""
+
+
 class CustomTitleBar(QWidget):
     """
     Custom title bar with window controls and navigation.
@@ -39,18 +94,14 @@ class CustomTitleBar(QWidget):
         super().__init__(parent)
         
         self.setFixedHeight(60)
-        self.setStyleSheet(f"""
-            CustomTitleBar {{
-                background: {COLORS['background_elevated']};
-                border-bottom: 1px solid {COLORS['border']};
-                border-top-left-radius: 12px;
-                border-top-right-radius: 12px;
-            }}
-        """)
+        self.setStyleSheet(TITLEBAR_QSS)
         
         # For window dragging
         self.drag_position = QPoint()
         
+        # Currently highlighted nav tab (see set_active_tab)
+        self._active_tab = None
+        
         self._create_ui()
         from .theme import get_stylesheet
 
@@ -67,16 +118,21 @@ class CustomTitleBar(QWidget):
         logo = QLabel()
         root = Path(__file__).resolve().parents[1]
         logo_path = root / "assets" / "logo.png"
-        pix = QPixmap(str(logo_path))
         TARGET_HEIGHT = 36
+        # Decode straight to the target height and convert once
+        reader = QImageReader(str(logo_path))
+        src_size = reader.size()
+        if src_size.isValid():
+            width = max(1, round(src_size.width() * TARGET_HEIGHT / src_size.height()))
+            reader.setScaledSize(QSize(width, TARGET_HEIGHT))
+        pix = QPixmap.fromImage(reader.read())
         if not pix.isNull():
-            pix = pix.scaledToHeight(TARGET_HEIGHT, Qt.SmoothTransformation)
             logo.setPixmap(pix)
         else:
             logo.setText("QID")
         logo.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
         logo.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        logo.setStyleSheet("background: transparent; border: none;")
+        logo.setObjectName("title_logo")
         left_container.addWidget(logo)
 
         # Nav buttons
@@ -120,12 +176,7 @@ class CustomTitleBar(QWidget):
         self.stats_label = QLabel("Database: 0 images")
         font = QFont("Inter, Segoe UI", 11)
         self.stats_label.setFont(font)
-        self.stats_label.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            background: transparent;
-            padding: 0;
-            border: none;
-        """)
+        self.stats_label.setObjectName("title_stats")
         self.stats_label.setAlignment(Qt.AlignCenter)
         self.stats_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
@@ -138,24 +189,9 @@ class CustomTitleBar(QWidget):
 
     def update_for_maximized(self, is_maximized: bool):
         """Update title bar styling for maximized state."""
-        if is_maximized:
-            self.setStyleSheet(f"""
-                CustomTitleBar {{
-                    background: {COLORS['background_elevated']};
-                    border-bottom: 1px solid {COLORS['border']};
-                    border-top-left-radius: 0px;
-                    border-top-right-radius: 0px;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                CustomTitleBar {{
-                    background: {COLORS['background_elevated']};
-                    border-bottom: 1px solid {COLORS['border']};
-                    border-top-left-radius: 12px;
-                    border-top-right-radius: 12px;
-                }}
-            """)
+        # Restyle through the [maximized] rule instead of a new stylesheet
+        self.setProperty("maximized", "true" if is_maximized else "false")
+        self.style().polish(self)
 
     def _create_nav_button(self, text: str) -> QPushButton:
         """Create navigation button."""
@@ -165,23 +201,6 @@ class CustomTitleBar(QWidget):
         btn.setFont(font)
         btn.setFixedHeight(36)
         btn.setObjectName("nav_btn")
-        btn.setStyleSheet(f"""
-            QPushButton#nav_btn {{
-                background: transparent;
-                border: none;
-                border-radius: 8px;
-                padding: 0 16px;
-                color: {COLORS['text_secondary']};
-            }}
-            QPushButton#nav_btn:hover {{
-                background: {COLORS['background_hover']};
-                color: {COLORS['text_primary']};
-            }}
-            QPushButton#nav_btn[active="true"] {{
-                background: {COLORS['primary']};
-                color: white;
-            }}
-        """)
         return btn
     
     def _create_control_button(self, role: str) -> QPushButton:
@@ -192,53 +211,43 @@ class CustomTitleBar(QWidget):
         font = QFont("Inter, Segoe UI", 14, QFont.Bold)
         btn.setFont(font)
 
+        # Styled by the #control_button / #close_btn rules in TITLEBAR_QSS
+        btn.setObjectName("close_btn" if role == "close" else "control_button")
+
         if role == "min":
             btn.setIcon(self.style().standardIcon(QStyle.SP_TitleBarMinButton))
         elif role == "max":
             btn.setIcon(self.style().standardIcon(QStyle.SP_TitleBarMaxButton))
         elif role == "close":
             btn.setIcon(self.style().standardIcon(QStyle.SP_TitleBarCloseButton))
-            btn.setObjectName("close_btn")
-
-        base_style = f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                border-radius: 6px;
-                color: {COLORS['text_primary']};
-            }}
-            QPushButton:hover {{
-                background: {{hover_color}};
-                color: white;
-            }}
-        """
-
-        if role == "close":
-            btn.setStyleSheet(base_style.replace("{hover_color}", "#ff4d4f"))
-        else:
-            btn.setStyleSheet(base_style.replace("{hover_color}", COLORS['background_hover']))
 
         return btn
     
     def set_active_tab(self, tab: str):
         """Set active navigation tab."""
-        self.home_btn.setProperty("active", "false")
-        self.search_btn.setProperty("active", "false")
-        self.index_btn.setProperty("active", "false")
-        self.settings_btn.setProperty("active", "false")
+        if tab == self._active_tab:
+            return
         
-        if tab == "home":
-            self.home_btn.setProperty("active", "true")
-        elif tab == "search":
-            self.search_btn.setProperty("active", "true")
-        elif tab == "index":
-            self.index_btn.setProperty("active", "true")
-        elif tab == "settings":
-            self.settings_btn.setProperty("active", "true")
+        buttons = {
+            "home": self.home_btn,
+            "search": self.search_btn,
+            "index": self.index_btn,
+            "settings": self.settings_btn,
+        }
         
-        for btn in [self.home_btn, self.search_btn, self.index_btn, self.settings_btn]:
-            btn.style().unpolish(btn)
-            btn.style().polish(btn)
+        # Only the buttons whose [active] state flips need repolishing;
+        # polish() alone re-evaluates the property selectors
+        previous = buttons.get(self._active_tab)
+        if previous is not None:
+            previous.setProperty("active", "false")
+            previous.style().polish(previous)
+        
+        current = buttons.get(tab)
+        if current is not None:
+            current.setProperty("active", "true")
+            current.style().polish(current)
+        
+        self._active_tab = tab
     
     def update_stats(self, text: str):
         self.stats_label.setText(text)
@@ -452,13 +461,13 @@ class MainWindowQt(QMainWindow):
         self.content_stack.setCurrentWidget(self.settings_screen)
         self.title_bar.set_active_tab("settings")
     
-    def _on_index_complete(self, stats: dict):
+    def _on_index_complete(self, stats: IndexStats):
         """Handle index completion."""
         self._update_stats()
         QMessageBox.information(
             self,
             "Indexing Complete",
-            f"Successfully indexed {stats['processed']} images!\n\n"
+            f"Successfully indexed {stats.processed} images!\n\n"
             f"Total in database: {len(self.batch_indexer.metadata_store):,} images"
         )
     
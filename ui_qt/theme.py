@@ -3,6 +3,10 @@ QID - Modern Dark Theme
 Color palette and styling system inspired by modern design trends.
 """
 
+from pathlib import Path
+
+from PySide6.QtGui import QFont, QFontDatabase
+
 # Color Palette (from your UI designs)
 COLORS = {
     # Backgrounds
@@ -99,6 +103,46 @@ EASING = {
 }
 
 
+# Qt fonts: preferred family first, fallbacks after. Inter is used when
+# assets/Inter.ttf ships with the app or it's installed system-wide
+FONT_FAMILY = "Inter"
+FONT_FALLBACKS = ["Segoe UI", "sans-serif"]
+FONT_FILE = Path(__file__).parent.parent / "assets" / "Inter.ttf"
+
+# (point size, weight) -> shared QFont, filled by get_font()
+_font_cache = {}
+
+
+def register_fonts():
+    """
+    Register the bundled Inter font (if present) with Qt.
+    Call once, after the QApplication exists.
+    """
+    if FONT_FILE.exists():
+        QFontDatabase.addApplicationFont(str(FONT_FILE))
+
+
+def get_font(size: int, weight: QFont.Weight = QFont.Normal) -> QFont:
+    """
+    Shared QFont for a point size and weight.
+    
+    Fonts are built once with an explicit family list, so Qt resolves
+    the family a single time instead of on every widget construction.
+    Needs a QApplication.
+    """
+    key = (size, weight)
+    font = _font_cache.get(key)
+    
+    if font is None:
+        font = QFont()
+        font.setFamilies([FONT_FAMILY, *FONT_FALLBACKS])
+        font.setPointSize(size)
+        font.setWeight(weight)
+        _font_cache[key] = font
+    
+    return font
+
+
 def get_stylesheet() -> str:
     """
     Generate the complete QSS stylesheet.